@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Adaptive difficulty module
+Keeps an exponential moving accuracy per user and question and turns it into
+question weights: questions the user has not mastered yet keep full weight,
+mastered ones are asked rarely, so practice goes to the gaps and the overall
+success rate settles in the target band.
+
+Accuracies and weights are stored as byte strings with one byte per question
+(0 = 0%, 255 = 100%), so an update is O(1) and recomputing the weights of any
+number of users is a single bytes.translate() call per user.
+
+Recompute the stored weights of all users (e.g. after tuning the target band):
+
+    python adaptive.py
+"""
+
+import logging
+import math
+from typing import Optional, Tuple
+
+from quiz_data import ALL_QUESTIONS
+
+logger = logging.getLogger(__name__)
+
+QUESTION_COUNT = len(ALL_QUESTIONS)
+
+# Smoothing factor of the moving accuracy (weight of the newest answer)
+EMA_ALPHA = 0.25
+
+# Upper edge of the 70-85% target success rate band: questions above it
+# count as mastered and their weight falls off
+TARGET_HIGH = 0.85
+
+# How fast the weight falls off above the target band
+WIDTH_ABOVE = 0.08
+
+# Smallest weight, so that every question can still be asked
+MIN_WEIGHT = 0.05
+
+# Accuracy assumed for questions the user has never answered
+INITIAL_ACCURACY = 128
+
+def _weight_for_accuracy(accuracy: float) -> int:
+    """Map an accuracy (0-1) to a question weight byte (1-255)."""
+    if accuracy > TARGET_HIGH:
+        distance = (accuracy - TARGET_HIGH) / WIDTH_ABOVE
+    else:
+        distance = 0
+    weight = max(MIN_WEIGHT, math.exp(-distance * distance))
+    return max(1, round(weight * 255))
+
+# Accuracy byte -> weight byte, used with bytes.translate()
+WEIGHT_TABLE = bytes(_weight_for_accuracy(level / 255) for level in range(256))
+
+INITIAL_ACCURACIES = bytes([INITIAL_ACCURACY]) * QUESTION_COUNT
+INITIAL_WEIGHTS = INITIAL_ACCURACIES.translate(WEIGHT_TABLE)
+
+def _is_current(values: Optional[bytes]) -> bool:
+    """
+    Check that stored per-question bytes match the current question list.
+
+    Blobs written before questions were added or removed have another
+    length and their indexes no longer line up, so they are started over.
+    """
+    return values is not None and len(values) == QUESTION_COUNT
+
+def update_question_accuracy(accuracies: bytes, weights: bytes, index: int,
+                             correct: bool) -> Tuple[bytes, bytes]:
+    """
+    Fold one answer into a user's per-question accuracies and weights.
+
+    Args:
+        accuracies: Accuracy bytes in ALL_QUESTIONS order (None for a new user,
+            reset if the question list changed)
+        weights: Weight bytes in ALL_QUESTIONS order (None for a new user)
+        index: Index of the answered question in ALL_QUESTIONS
+        correct: Whether the answer was correct
+
+    Returns:
+        Tuple of (accuracies, weights)
+    """
+    if not _is_current(accuracies):
+        accuracies = INITIAL_ACCURACIES
+        weights = INITIAL_WEIGHTS
+    elif not _is_current(weights):
+        weights = compute_weights(accuracies)
+
+    accuracies = bytearray(accuracies)
+    weights = bytearray(weights)
+
+    if 0 <= index < QUESTION_COUNT:
+        target = 255 if correct else 0
+        current = accuracies[index]
+        accuracies[index] = current + round(EMA_ALPHA * (target - current))
+        weights[index] = WEIGHT_TABLE[accuracies[index]]
+
+    return bytes(accuracies), bytes(weights)
+
+def update_rolling_accuracy(rolling_accuracy: float, correct: bool) -> float:
+    """Fold one answer into a user's overall moving accuracy (0-1)."""
+    return rolling_accuracy + EMA_ALPHA * ((1.0 if correct else 0.0) - rolling_accuracy)
+
+def compute_weights(accuracies: bytes) -> bytes:
+    """Recompute all question weights from stored accuracies."""
+    if not _is_current(accuracies):
+        return INITIAL_WEIGHTS
+    return accuracies.translate(WEIGHT_TABLE)
+
+def main():
+    """Recompute the stored question weights of all users."""
+    # Imported here because database imports this module
+    from database import init_database, recompute_question_weights
+
+    logging.basicConfig(
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        level=logging.INFO
+    )
+
+    init_database()
+    print(f"Recomputed weights for {recompute_question_weights()} users")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Backup module
+Command line tools for hot snapshots and bulk export/import of the bot database:
+
+    python backup.py snapshot backups/quiz_bot.db
+    python backup.py export users.jsonl.gz
+    python backup.py import users.jsonl.gz
+
+Export and import formats are chosen by file name: .jsonl or .csv, optionally
+gzip-compressed with a .gz suffix. CSV writes NULL as \\N.
+"""
+
+import argparse
+import base64
+import csv
+import gzip
+import json
+import logging
+import os
+import sqlite3
+from typing import Any, Dict, Iterator, List
+
+import database
+from database import get_db_connection, init_database
+
+logger = logging.getLogger(__name__)
+
+# Tables that can be exported and imported
+EXPORT_TABLES = ('users', 'broadcasts')
+
+# Rows fetched from or written to the database at a time
+CHUNK_SIZE = 5000
+
+# CSV has no NULL, so it is written as this marker (as PostgreSQL and MySQL do)
+CSV_NULL = '\\N'
+
+# Database pages copied per online backup step
+BACKUP_PAGES_PER_STEP = 1024
+
+def open_dump_file(path: str, mode: str):
+    """Open an export file as text, transparently handling gzip compression."""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', newline='')
+    return open(path, mode, encoding='utf-8', newline='')
+
+def get_dump_format(path: str) -> str:
+    """Get the dump format ('jsonl' or 'csv') from the file name."""
+    name = path[:-3] if path.endswith('.gz') else path
+    if name.endswith('.jsonl'):
+        return 'jsonl'
+    elif name.endswith('.csv'):
+        return 'csv'
+    else:
+        raise ValueError(f"Unsupported file format: {path}")
+
+def get_table_columns(conn: sqlite3.Connection, table: str) -> Dict[str, str]:
+    """Get column names and declared types of a table, in table order."""
+    cursor = conn.execute(f"PRAGMA table_info({table})")
+    return {column[1]: column[2].upper() for column in cursor.fetchall()}
+
+def snapshot_database(dest_path: str) -> int:
+    """
+    Copy the live database to dest_path using the SQLite online backup API.
+
+    The copy is made in steps, so the bot can keep writing while the snapshot
+    is taken, and the result is a consistent point-in-time image.
+
+    Returns:
+        Number of pages copied
+    """
+    pages_copied = 0
+
+    def progress(status, remaining, total):
+        nonlocal pages_copied
+        pages_copied = total - remaining
+
+    with get_db_connection() as conn:
+        dest = sqlite3.connect(dest_path)
+        try:
+            conn.backup(dest, pages=BACKUP_PAGES_PER_STEP, progress=progress)
+        finally:
+            dest.close()
+
+    logger.info(f"Snapshot written to {dest_path} ({pages_copied} pages)")
+    return pages_copied
+
+def iter_table_rows(conn: sqlite3.Connection, table: str) -> Iterator[Dict[str, Any]]:
+    """Stream all rows of a table without loading them into memory, BLOBs as base64."""
+    cursor = conn.execute(f"SELECT * FROM {table} ORDER BY rowid")
+    while True:
+        rows = cursor.fetchmany(CHUNK_SIZE)
+        if not rows:
+            return
+        for row in rows:
+            yield {
+                key: base64.b64encode(value).decode('ascii') if isinstance(value, bytes) else value
+                for key, value in dict(row).items()
+            }
+
+def export_table(path: str, table: str = 'users') -> int:
+    """
+    Export a table to a JSONL or CSV file.
+
+    Returns:
+        Number of exported rows
+    """
+    dump_format = get_dump_format(path)
+    count = 0
+
+    with get_db_connection() as conn, open_dump_file(path, 'w') as f:
+        if dump_format == 'csv':
+            writer = csv.DictWriter(f, fieldnames=list(get_table_columns(conn, table)))
+            writer.writeheader()
+            for row in iter_table_rows(conn, table):
+                writer.writerow({key: CSV_NULL if value is None else value for key, value in row.items()})
+                count += 1
+        else:
+            for row in iter_table_rows(conn, table):
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+                count += 1
+
+    logger.info(f"Exported {count} rows from {table} to {path}")
+    return count
+
+def iter_dump_rows(path: str, columns: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+    """Read rows back from a JSONL or CSV export."""
+    with open_dump_file(path, 'r') as f:
+        if get_dump_format(path) == 'csv':
+            # Exports without the NULL marker wrote None as an empty field,
+            # which is only unambiguous for non-TEXT columns
+            rows = (
+                {
+                    key: None if value == CSV_NULL or (value == '' and columns.get(key, 'TEXT') != 'TEXT') else value
+                    for key, value in row.items()
+                }
+                for row in csv.DictReader(f)
+            )
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+
+        for row in rows:
+            for key, value in row.items():
+                if columns.get(key) == 'BLOB' and value is not None:
+                    row[key] = base64.b64decode(value)
+            yield row
+
+def import_table(path: str, table: str = 'users') -> int:
+    """
+    Import rows from a JSONL or CSV export, replacing rows with the same key.
+
+    Rows are written with executemany in chunks inside a single transaction,
+    so a failed import leaves the database unchanged. Afterwards the
+    statistics caches are invalidated, including that of a running bot.
+
+    Returns:
+        Number of imported rows
+    """
+    count = 0
+
+    with get_db_connection() as conn:
+        columns = get_table_columns(conn, table)
+        chunk: List[Dict[str, Any]] = []
+        query = None
+
+        try:
+            for row in iter_dump_rows(path, columns):
+                if query is None:
+                    names = [name for name in row if name in columns]
+                    query = (
+                        f"INSERT OR REPLACE INTO {table} ({', '.join(names)}) "
+                        f"VALUES ({', '.join(':' + name for name in names)})"
+                    )
+
+                chunk.append(row)
+                if len(chunk) >= CHUNK_SIZE:
+                    conn.executemany(query, chunk)
+                    count += len(chunk)
+                    chunk = []
+
+            if chunk:
+                conn.executemany(query, chunk)
+                count += len(chunk)
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    # Makes a running bot reload the imported users
+    database.invalidate_user_stats()
+    logger.info(f"Imported {count} rows into {table} from {path}")
+    return count
+
+def main():
+    """Run backup tools from the command line."""
+    parser = argparse.ArgumentParser(description="Snapshot, export and import the quiz bot database")
+    parser.add_argument('--db', default=database.DATABASE_FILE, help="Database file")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    snapshot_parser = subparsers.add_parser('snapshot', help="Consistent copy of the live database")
+    snapshot_parser.add_argument('dest', help="Destination database file")
+
+    for name, help_text in (('export', "Export a table to .jsonl/.csv[.gz]"),
+                            ('import', "Import a table from .jsonl/.csv[.gz], safe while the bot runs")):
+        subparser = subparsers.add_parser(name, help=help_text)
+        subparser.add_argument('path', help="Export file")
+        subparser.add_argument('--table', choices=EXPORT_TABLES, default='users')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        level=logging.INFO
+    )
+
+    # Only import may create the database, a mistyped --db would otherwise
+    # snapshot or export an empty one
+    if args.command != 'import' and not os.path.exists(args.db):
+        parser.error(f"database {args.db} does not exist")
+
+    database.DATABASE_FILE = args.db
+    init_database()
+
+    if args.command == 'snapshot':
+        snapshot_database(args.dest)
+    elif args.command == 'export':
+        print(f"Exported {export_table(args.path, args.table)} rows")
+    elif args.command == 'import':
+        print(f"Imported {import_table(args.path, args.table)} rows")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Broadcast module
+Sends a message to many users with Telegram rate limits, resumable progress
+and opt-out tracking. Intended to be run as a scheduled job, e.g.:
+
+    python broadcast.py --id reminder-2025-09-01 --inactive-days 1
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+from telegram import Bot
+from telegram.constants import ParseMode
+from telegram.error import BadRequest, Forbidden, RetryAfter, TelegramError
+
+from database import (
+    init_database, iter_broadcast_targets, get_broadcast, create_broadcast,
+    update_broadcast_text, save_broadcast_checkpoint, set_notifications_enabled,
+    invalidate_user_stats
+)
+from i18n import get_locale
+from keyboards import get_main_menu_keyboard
+
+logger = logging.getLogger(__name__)
+
+# Telegram allows about 30 messages per second to different chats
+MESSAGES_PER_SECOND = 25
+
+# User IDs loaded from the database at a time
+BATCH_SIZE = 500
+
+# Messages sent between two checkpoints - at most this many are sent again
+# when an interrupted broadcast resumes
+CHECKPOINT_SIZE = 25
+
+# BadRequest descriptions meaning the recipient is gone rather than the
+# message being invalid
+CHAT_GONE_ERRORS = ('chat not found', 'user is deactivated', 'peer_id_invalid')
+
+DAILY_REMINDER_TEXT = """
+⏰ <b>Пора потренироваться!</b>
+
+Ты давно не проходил тест. Несколько минут практики в день помогут лучше запомнить номера вопросов 💪
+
+Чтобы отключить напоминания, отправь /reminders
+"""
+
+class RateLimiter:
+    """Token bucket limiting how many messages are sent per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a message may be sent."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def pause(self, seconds: float):
+        """Block all senders, used when Telegram answers with RetryAfter."""
+        async with self.lock:
+            await asyncio.sleep(seconds)
+            self.tokens = 0
+            self.updated_at = time.monotonic()
+
+def is_chat_gone(error: BadRequest) -> bool:
+    """Check whether a BadRequest means the chat or user no longer exists."""
+    message = error.message.lower()
+    return any(reason in message for reason in CHAT_GONE_ERRORS)
+
+async def send_to_user(bot: Bot, limiter: RateLimiter, user_id: int, text: str,
+                       opted_out: List[int]) -> bool:
+    """
+    Send the broadcast message to one user.
+
+    Args:
+        opted_out: Gets user_id appended if the user was opted out
+
+    Returns:
+        True if the message was delivered, False otherwise
+
+    Raises:
+        BadRequest: If the message itself was rejected (e.g. invalid HTML),
+            since it would fail for every other user as well
+    """
+    for _ in range(3):
+        await limiter.acquire()
+        try:
+            await bot.send_message(
+                chat_id=user_id,
+                text=text,
+                parse_mode=ParseMode.HTML,
+                reply_markup=get_main_menu_keyboard(get_locale())
+            )
+            return True
+        except RetryAfter as e:
+            logger.warning(f"Flood limit hit, pausing for {e.retry_after}s")
+            await limiter.pause(e.retry_after)
+        except Forbidden as e:
+            # Bot was blocked - stop notifying this user
+            set_notifications_enabled(user_id, False)
+            opted_out.append(user_id)
+            logger.info(f"Opted out user {user_id}: {e}")
+            return False
+        except BadRequest as e:
+            if not is_chat_gone(e):
+                raise
+            set_notifications_enabled(user_id, False)
+            opted_out.append(user_id)
+            logger.info(f"Opted out user {user_id}: {e}")
+            return False
+        except TelegramError as e:
+            logger.error(f"Error sending broadcast to {user_id}: {e}")
+            return False
+
+    return False
+
+async def run_broadcast(bot: Bot, broadcast_id: str, text: Optional[str] = None,
+                        inactive_days: Optional[int] = None,
+                        rate: float = MESSAGES_PER_SECOND,
+                        batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+    """
+    Send a broadcast to all subscribed users, resuming from the last checkpoint.
+
+    Args:
+        bot: Telegram bot used for sending
+        broadcast_id: Unique name of the broadcast, used as the checkpoint key
+        text: Message text (required for a new broadcast, replaces the stored
+            text when resuming, e.g. after fixing invalid HTML)
+        inactive_days: Only target users inactive for at least that many days
+        rate: Maximum messages per second
+        batch_size: Number of user IDs loaded from the database at a time
+
+    Returns:
+        Dictionary with sent and failed counts
+
+    Raises:
+        BadRequest: If Telegram rejects the message itself; the checkpoint
+            is kept, so the broadcast can be resumed with a corrected text
+    """
+    progress = get_broadcast(broadcast_id)
+
+    if progress is None:
+        if text is None:
+            raise ValueError(f"Unknown broadcast: {broadcast_id}")
+        create_broadcast(broadcast_id, text)
+        progress = get_broadcast(broadcast_id)
+    elif progress['status'] == 'done':
+        logger.info(f"Broadcast {broadcast_id} already finished")
+        return {'sent': progress['sent_count'], 'failed': progress['failed_count']}
+    else:
+        logger.info(f"Resuming broadcast {broadcast_id} after user {progress['last_user_id']}")
+        if text is not None and text != progress['message_text']:
+            update_broadcast_text(broadcast_id, text)
+            progress['message_text'] = text
+            logger.info(f"Replaced the message text of broadcast {broadcast_id}")
+
+    text = progress['message_text']
+    sent_count = progress['sent_count']
+    failed_count = progress['failed_count']
+    last_user_id = progress['last_user_id']
+    limiter = RateLimiter(rate)
+
+    for batch in iter_broadcast_targets(last_user_id, batch_size, inactive_days):
+        for start in range(0, len(batch), CHECKPOINT_SIZE):
+            chunk = batch[start:start + CHECKPOINT_SIZE]
+            opted_out = []
+            try:
+                results = await asyncio.gather(
+                    *(send_to_user(bot, limiter, user_id, text, opted_out) for user_id in chunk)
+                )
+            except BadRequest as e:
+                logger.error(f"Broadcast {broadcast_id} aborted, Telegram rejected the message: {e}")
+                if opted_out:
+                    invalidate_user_stats()
+                raise
+
+            delivered = sum(results)
+            sent_count += delivered
+            failed_count += len(results) - delivered
+            last_user_id = chunk[-1]
+
+            save_broadcast_checkpoint(broadcast_id, last_user_id, sent_count, failed_count)
+            # One invalidation per chunk rather than per user keeps the bot's
+            # cache from being cleared over and over during a long broadcast
+            if opted_out:
+                invalidate_user_stats()
+
+        logger.info(f"Broadcast {broadcast_id}: {sent_count} sent, {failed_count} failed")
+
+    save_broadcast_checkpoint(broadcast_id, last_user_id, sent_count, failed_count, status='done')
+
+    return {'sent': sent_count, 'failed': failed_count}
+
+def main():
+    """Run a broadcast from the command line."""
+    parser = argparse.ArgumentParser(description="Send a message to all subscribed users")
+    parser.add_argument('--id', required=True, help="Broadcast ID, reuse it to resume")
+    parser.add_argument('--text', help="Message text (HTML), defaults to the daily reminder")
+    parser.add_argument('--inactive-days', type=int, help="Only users inactive for N days")
+    parser.add_argument('--rate', type=float, default=MESSAGES_PER_SECOND, help="Messages per second")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        level=logging.INFO
+    )
+
+    token = os.getenv('TELEGRAM_BOT_TOKEN')
+    if not token:
+        print("ERROR: TELEGRAM_BOT_TOKEN environment variable is not set!")
+        return
+
+    init_database()
+
+    text = args.text
+    if text is None and get_broadcast(args.id) is None:
+        text = DAILY_REMINDER_TEXT
+
+    async def run():
+        async with Bot(token) as bot:
+            return await run_broadcast(
+                bot, args.id, text,
+                inactive_days=args.inactive_days, rate=args.rate
+            )
+
+    try:
+        result = asyncio.run(run())
+    except BadRequest as e:
+        print(f"Broadcast aborted: {e}. Fix the text and rerun with the same --id and --text to resume.")
+        return
+    print(f"Broadcast finished: {result['sent']} sent, {result['failed']} failed")
+
+if __name__ == '__main__':
+    main()
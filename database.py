@@ -0,0 +1,634 @@
+"""
+Database module for handling user statistics and quiz data
+"""
+
+import sqlite3
+import logging
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Iterator, List
+
+from adaptive import update_question_accuracy, update_rolling_accuracy, compute_weights
+from quiz_data import get_question_index
+
+logger = logging.getLogger(__name__)
+
+DATABASE_FILE = 'quiz_bot.db'
+
+# Bump whenever init_database creates or migrates something new
+SCHEMA_VERSION = 6
+
+# First schema version whose stored question weights use the current
+# adaptive weight curve; older databases get their weights recomputed
+WEIGHT_CURVE_VERSION = 6
+
+# Columns added after the first release: (name, definition)
+USER_COLUMN_MIGRATIONS = [
+    ('lives_left', 'INTEGER DEFAULT 3'),
+    ('notifications_enabled', 'INTEGER DEFAULT 1'),
+    ('last_active', 'TIMESTAMP'),
+    ('rolling_accuracy', 'REAL DEFAULT 0.5'),
+    ('question_accuracy', 'BLOB'),
+    ('question_weights', 'BLOB'),
+    ('exam_deck', 'BLOB'),
+    ('exam_cursor', 'INTEGER DEFAULT 0'),
+    ('exam_correct', 'INTEGER DEFAULT 0'),
+    ('exam_mistakes', 'INTEGER DEFAULT 0'),
+]
+
+# Maximum number of users kept in the in-memory statistics cache
+STATS_CACHE_SIZE = 10000
+
+# user_id -> statistics row, least recently used first
+_stats_cache: 'OrderedDict[int, Dict[str, Any]]' = OrderedDict()
+
+# bot_state counter bumped by invalidate_user_stats, so that other processes
+# (the running bot) drop their caches after command line tools wrote users
+STATS_GENERATION_KEY = 'stats_generation'
+
+# Seconds between two checks of the counter by a process with a cache
+STATS_GENERATION_CHECK_INTERVAL = 2
+
+_stats_generation: Optional[str] = None
+_stats_generation_checked_at = 0.0
+
+def init_database():
+    """
+    Initialize the SQLite database with required tables.
+    
+    Skips all schema work when the stored user_version is already current,
+    which keeps restarts cheap.
+    """
+    with sqlite3.connect(DATABASE_FILE) as conn:
+        cursor = conn.cursor()
+        
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+        if version == SCHEMA_VERSION:
+            logger.info("Database schema is up to date")
+            return
+        
+        # Create users table for statistics
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                user_id INTEGER PRIMARY KEY,
+                username TEXT,
+                first_name TEXT,
+                current_streak INTEGER DEFAULT 0,
+                best_streak INTEGER DEFAULT 0,
+                total_questions INTEGER DEFAULT 0,
+                correct_answers INTEGER DEFAULT 0,
+                quiz_mode TEXT DEFAULT 'none',
+                last_question_number INTEGER DEFAULT 0,
+                last_question_source TEXT DEFAULT '',
+                lives_left INTEGER DEFAULT 3,
+                notifications_enabled INTEGER DEFAULT 1,
+                last_active TIMESTAMP,
+                rolling_accuracy REAL DEFAULT 0.5,
+                question_accuracy BLOB,
+                question_weights BLOB,
+                exam_deck BLOB,
+                exam_cursor INTEGER DEFAULT 0,
+                exam_correct INTEGER DEFAULT 0,
+                exam_mistakes INTEGER DEFAULT 0
+            )
+        ''')
+        
+        # Check for columns added after the first release and add missing ones
+        cursor.execute("PRAGMA table_info(users)")
+        columns = [column[1] for column in cursor.fetchall()]
+        
+        for column, definition in USER_COLUMN_MIGRATIONS:
+            if column not in columns:
+                cursor.execute(f'ALTER TABLE users ADD COLUMN {column} {definition}')
+                logger.info(f"Added {column} column to existing users table")
+        
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_last_active ON users (last_active)')
+        
+        # Create broadcasts table for resumable mass mailings
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS broadcasts (
+                broadcast_id TEXT PRIMARY KEY,
+                message_text TEXT NOT NULL,
+                last_user_id INTEGER DEFAULT 0,
+                sent_count INTEGER DEFAULT 0,
+                failed_count INTEGER DEFAULT 0,
+                status TEXT DEFAULT 'running',
+                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Create key-value table for bot runtime state (e.g. polling offset)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS bot_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        ''')
+        
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+        logger.info("Database initialized successfully")
+    
+    if 0 < version < WEIGHT_CURVE_VERSION:
+        logger.info(f"Recomputed question weights of {recompute_question_weights()} users")
+
+@contextmanager
+def get_db_connection():
+    """Context manager for database connections."""
+    conn = sqlite3.connect(DATABASE_FILE)
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+def _calculate_accuracy(stats: Dict[str, Any]) -> float:
+    """Get the share of correct answers in percent."""
+    if stats['total_questions'] > 0:
+        return (stats['correct_answers'] / stats['total_questions']) * 100
+    return 0
+
+def _cache_stats(user_id: int, stats: Dict[str, Any]):
+    """Store a statistics row in the cache, evicting the least recently used one."""
+    stats['accuracy'] = _calculate_accuracy(stats)
+    _stats_cache[user_id] = stats
+    _stats_cache.move_to_end(user_id)
+    
+    if len(_stats_cache) > STATS_CACHE_SIZE:
+        _stats_cache.popitem(last=False)
+
+def _update_cached_stats(user_id: int, **fields):
+    """Update a cached statistics row in place, if the user is cached."""
+    stats = _stats_cache.get(user_id)
+    if stats is not None:
+        stats.update(fields)
+        stats['accuracy'] = _calculate_accuracy(stats)
+
+def invalidate_user_stats(user_id: Optional[int] = None):
+    """
+    Drop one user (or everyone) from the statistics cache.
+    
+    Also bumps the shared generation counter, so every other process clears
+    its whole cache within STATS_GENERATION_CHECK_INTERVAL seconds. Call it
+    after writing users outside of the functions below.
+    """
+    if user_id is None:
+        _stats_cache.clear()
+    else:
+        _stats_cache.pop(user_id, None)
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO bot_state (key, value) VALUES (?, '1')
+            ON CONFLICT (key) DO UPDATE SET value = CAST(value AS INTEGER) + 1
+        ''', (STATS_GENERATION_KEY,))
+        conn.commit()
+
+def _check_stats_generation():
+    """Clear the cache if another process invalidated statistics since the last check."""
+    global _stats_generation, _stats_generation_checked_at
+    
+    now = time.monotonic()
+    if now - _stats_generation_checked_at < STATS_GENERATION_CHECK_INTERVAL:
+        return
+    _stats_generation_checked_at = now
+    
+    generation = get_bot_state(STATS_GENERATION_KEY)
+    if generation != _stats_generation:
+        _stats_cache.clear()
+        _stats_generation = generation
+
+def get_user_stats(user_id: int) -> Dict[str, Any]:
+    """
+    Get user statistics, including the derived accuracy in percent.
+    
+    Served from an in-memory LRU cache that the write functions below keep
+    up to date, so repeated reads do not touch the database. Writes made by
+    other processes are picked up through invalidate_user_stats().
+    """
+    _check_stats_generation()
+    
+    stats = _stats_cache.get(user_id)
+    if stats is not None:
+        _stats_cache.move_to_end(user_id)
+        return dict(stats)
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM users WHERE user_id = ?', (user_id,))
+        row = cursor.fetchone()
+        
+        if row:
+            stats = dict(row)
+        else:
+            # Create new user record
+            cursor.execute('''
+                INSERT INTO users (user_id, current_streak, best_streak, total_questions, correct_answers, lives_left)
+                VALUES (?, 0, 0, 0, 0, 3)
+            ''', (user_id,))
+            conn.commit()
+            stats = {
+                'user_id': user_id,
+                'username': None,
+                'first_name': None,
+                'current_streak': 0,
+                'best_streak': 0,
+                'total_questions': 0,
+                'correct_answers': 0,
+                'quiz_mode': 'none',
+                'last_question_number': 0,
+                'last_question_source': '',
+                'lives_left': 3,
+                'notifications_enabled': 1,
+                'last_active': None,
+                'rolling_accuracy': 0.5,
+                'question_accuracy': None,
+                'question_weights': None,
+                'exam_deck': None,
+                'exam_cursor': 0,
+                'exam_correct': 0,
+                'exam_mistakes': 0
+            }
+    
+    _cache_stats(user_id, stats)
+    return dict(stats)
+
+def update_user_info(user_id: int, username: str = None, first_name: str = None):
+    """Update user information."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE users 
+            SET username = ?, first_name = ?
+            WHERE user_id = ?
+        ''', (username, first_name, user_id))
+        conn.commit()
+    
+    _update_cached_stats(user_id, username=username, first_name=first_name)
+
+def update_user_quiz_mode(user_id: int, quiz_mode: str, question_number: int = 0, question_source: str = ''):
+    """Update user's current quiz mode and question."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE users 
+            SET quiz_mode = ?, last_question_number = ?, last_question_source = ?,
+                last_active = CURRENT_TIMESTAMP
+            WHERE user_id = ?
+        ''', (quiz_mode, question_number, question_source, user_id))
+        conn.commit()
+    
+    _update_cached_stats(user_id, quiz_mode=quiz_mode, last_question_number=question_number,
+                         last_question_source=question_source)
+
+def _get_adaptive_update(row: sqlite3.Row, correct: bool) -> Dict[str, Any]:
+    """Get the adaptive-mode columns updated with an answer to the current question."""
+    index = get_question_index(row['last_question_number'], row['last_question_source'])
+    accuracies, weights = update_question_accuracy(
+        row['question_accuracy'], row['question_weights'], index, correct
+    )
+    return {
+        'rolling_accuracy': update_rolling_accuracy(row['rolling_accuracy'], correct),
+        'question_accuracy': accuracies,
+        'question_weights': weights
+    }
+
+def record_correct_answer(user_id: int) -> Dict[str, Any]:
+    """Record a correct answer and update streaks."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        
+        # Get current stats
+        cursor.execute('''
+            SELECT current_streak, best_streak, total_questions, correct_answers,
+                   last_question_number, last_question_source,
+                   rolling_accuracy, question_accuracy, question_weights
+            FROM users WHERE user_id = ?
+        ''', (user_id,))
+        row = cursor.fetchone()
+        
+        if row:
+            current_streak = row['current_streak'] + 1
+            best_streak = max(row['best_streak'], current_streak)
+            new_record = current_streak > row['best_streak']
+            adaptive = _get_adaptive_update(row, True)
+            
+            # Update stats
+            cursor.execute('''
+                UPDATE users 
+                SET current_streak = ?, best_streak = ?, total_questions = total_questions + 1, 
+                    correct_answers = correct_answers + 1, last_active = CURRENT_TIMESTAMP,
+                    rolling_accuracy = ?, question_accuracy = ?, question_weights = ?
+                WHERE user_id = ?
+            ''', (current_streak, best_streak, adaptive['rolling_accuracy'],
+                  adaptive['question_accuracy'], adaptive['question_weights'], user_id))
+            conn.commit()
+            
+            _update_cached_stats(user_id, current_streak=current_streak, best_streak=best_streak,
+                                 total_questions=row['total_questions'] + 1,
+                                 correct_answers=row['correct_answers'] + 1, **adaptive)
+            
+            return {
+                'current_streak': current_streak,
+                'best_streak': best_streak,
+                'new_record': new_record
+            }
+        
+        return {'current_streak': 0, 'best_streak': 0, 'new_record': False}
+
+def record_incorrect_answer(user_id: int, use_lives: bool = True) -> Dict[str, Any]:
+    """Record an incorrect answer, reset current streak, and remove a life (if use_lives)."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        
+        # Get current lives
+        cursor.execute('''
+            SELECT lives_left, total_questions, last_question_number, last_question_source,
+                   rolling_accuracy, question_accuracy, question_weights
+            FROM users WHERE user_id = ?
+        ''', (user_id,))
+        row = cursor.fetchone()
+        
+        if row:
+            lives_left = max(0, row['lives_left'] - 1) if use_lives else row['lives_left']
+            game_over = lives_left == 0
+            adaptive = _get_adaptive_update(row, False)
+            
+            # Update stats
+            cursor.execute('''
+                UPDATE users 
+                SET current_streak = 0, total_questions = total_questions + 1, lives_left = ?,
+                    last_active = CURRENT_TIMESTAMP,
+                    rolling_accuracy = ?, question_accuracy = ?, question_weights = ?
+                WHERE user_id = ?
+            ''', (lives_left, adaptive['rolling_accuracy'], adaptive['question_accuracy'],
+                  adaptive['question_weights'], user_id))
+            conn.commit()
+            
+            _update_cached_stats(user_id, current_streak=0, lives_left=lives_left,
+                                 total_questions=row['total_questions'] + 1, **adaptive)
+            
+            return {
+                'lives_left': lives_left,
+                'game_over': game_over
+            }
+        
+        return {'lives_left': 0, 'game_over': True}
+
+def clear_quiz_mode(user_id: int):
+    """Clear user's quiz mode when stopping the test."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE users 
+            SET quiz_mode = 'none', last_question_number = 0, last_question_source = '', lives_left = 3
+            WHERE user_id = ?
+        ''', (user_id,))
+        conn.commit()
+    
+    _update_cached_stats(user_id, quiz_mode='none', last_question_number=0,
+                         last_question_source='', lives_left=3)
+
+def reset_lives(user_id: int):
+    """Reset user's lives to 3 when starting a new game."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE users 
+            SET lives_left = 3
+            WHERE user_id = ?
+        ''', (user_id,))
+        conn.commit()
+    
+    _update_cached_stats(user_id, lives_left=3)
+
+def start_exam(user_id: int, deck: bytes):
+    """Store a new mock exam deck and reset its progress."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE users 
+            SET exam_deck = ?, exam_cursor = 0, exam_correct = 0, exam_mistakes = 0
+            WHERE user_id = ?
+        ''', (deck, user_id))
+        conn.commit()
+    
+    _update_cached_stats(user_id, exam_deck=deck, exam_cursor=0, exam_correct=0, exam_mistakes=0)
+
+def record_exam_answer(user_id: int, correct: bool) -> Dict[str, Any]:
+    """
+    Move the exam cursor past the current question and record the result.
+    
+    Mistakes are kept as a bitmask: bit N is set when the answer to the
+    question at deck position N was wrong.
+    
+    Returns:
+        Dictionary with the updated exam_deck, exam_cursor, exam_correct and exam_mistakes
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT exam_deck, exam_cursor, exam_correct, exam_mistakes
+            FROM users WHERE user_id = ?
+        ''', (user_id,))
+        row = cursor.fetchone()
+        
+        exam = {
+            'exam_deck': row['exam_deck'],
+            'exam_cursor': row['exam_cursor'] + 1,
+            'exam_correct': row['exam_correct'] + (1 if correct else 0),
+            'exam_mistakes': row['exam_mistakes'] | (0 if correct else 1 << row['exam_cursor'])
+        }
+        
+        cursor.execute('''
+            UPDATE users 
+            SET exam_cursor = ?, exam_correct = ?, exam_mistakes = ?
+            WHERE user_id = ?
+        ''', (exam['exam_cursor'], exam['exam_correct'], exam['exam_mistakes'], user_id))
+        conn.commit()
+    
+    _update_cached_stats(user_id, **exam)
+    return exam
+
+def clear_exam(user_id: int):
+    """
+    Remove the finished mock exam of a user and leave quiz mode.
+    
+    Both happen in one UPDATE, so a user is never left in exam mode without
+    a deck.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE users 
+            SET exam_deck = NULL, exam_cursor = 0, exam_correct = 0, exam_mistakes = 0,
+                quiz_mode = 'none', last_question_number = 0, last_question_source = '', lives_left = 3
+            WHERE user_id = ?
+        ''', (user_id,))
+        conn.commit()
+    
+    _update_cached_stats(user_id, exam_deck=None, exam_cursor=0, exam_correct=0, exam_mistakes=0,
+                         quiz_mode='none', last_question_number=0, last_question_source='',
+                         lives_left=3)
+
+def set_notifications_enabled(user_id: int, enabled: bool):
+    """Opt a user in to or out of broadcast notifications."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE users 
+            SET notifications_enabled = ?
+            WHERE user_id = ?
+        ''', (1 if enabled else 0, user_id))
+        conn.commit()
+    
+    _update_cached_stats(user_id, notifications_enabled=1 if enabled else 0)
+
+def iter_broadcast_targets(after_user_id: int = 0, batch_size: int = 500,
+                           inactive_days: Optional[int] = None) -> Iterator[List[int]]:
+    """
+    Yield batches of user IDs that accept notifications, in ascending order.
+    
+    Uses keyset pagination on the primary key, so each batch is a single
+    index range scan and memory use does not grow with the number of users.
+    
+    Args:
+        after_user_id: Only return users with a greater ID (resume point)
+        batch_size: Maximum number of IDs per batch
+        inactive_days: If set, only users with no activity for that many days
+    """
+    query = 'SELECT user_id FROM users WHERE user_id > ? AND notifications_enabled = 1'
+    extra_params = ()
+    if inactive_days is not None:
+        query += " AND (last_active IS NULL OR last_active < datetime('now', ?))"
+        extra_params = (f'-{int(inactive_days)} days',)
+    query += ' ORDER BY user_id LIMIT ?'
+    
+    last_user_id = after_user_id
+    while True:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, (last_user_id, *extra_params, batch_size))
+            batch = [row['user_id'] for row in cursor.fetchall()]
+        
+        if not batch:
+            return
+        
+        yield batch
+        last_user_id = batch[-1]
+        
+        if len(batch) < batch_size:
+            return
+
+def get_broadcast(broadcast_id: str) -> Optional[Dict[str, Any]]:
+    """Get the stored progress of a broadcast, or None if it was never started."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM broadcasts WHERE broadcast_id = ?', (broadcast_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+def create_broadcast(broadcast_id: str, message_text: str):
+    """Register a new broadcast with an empty progress checkpoint."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO broadcasts (broadcast_id, message_text)
+            VALUES (?, ?)
+        ''', (broadcast_id, message_text))
+        conn.commit()
+
+def update_broadcast_text(broadcast_id: str, message_text: str):
+    """Replace the message text of an unfinished broadcast."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE broadcasts 
+            SET message_text = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE broadcast_id = ?
+        ''', (message_text, broadcast_id))
+        conn.commit()
+
+def save_broadcast_checkpoint(broadcast_id: str, last_user_id: int, sent_count: int,
+                              failed_count: int, status: str = 'running'):
+    """Persist broadcast progress so an interrupted run can resume."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE broadcasts 
+            SET last_user_id = ?, sent_count = ?, failed_count = ?, status = ?,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE broadcast_id = ?
+        ''', (last_user_id, sent_count, failed_count, status, broadcast_id))
+        conn.commit()
+
+def recompute_question_weights(batch_size: int = 1000) -> int:
+    """
+    Recompute the adaptive-mode question weights of all users from their
+    stored accuracies, in keyset-paginated batches.
+    
+    Returns:
+        Number of updated users
+    """
+    count = 0
+    last_user_id = 0
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        while True:
+            cursor.execute('''
+                SELECT user_id, question_accuracy FROM users
+                WHERE user_id > ? AND question_accuracy IS NOT NULL
+                ORDER BY user_id LIMIT ?
+            ''', (last_user_id, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            
+            cursor.executemany(
+                'UPDATE users SET question_weights = ? WHERE user_id = ?',
+                [(compute_weights(row['question_accuracy']), row['user_id']) for row in rows]
+            )
+            conn.commit()
+            
+            count += len(rows)
+            last_user_id = rows[-1]['user_id']
+    
+    invalidate_user_stats()
+    return count
+
+def get_bot_state(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Get a stored bot runtime value."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT value FROM bot_state WHERE key = ?', (key,))
+        row = cursor.fetchone()
+        return row['value'] if row else default
+
+def set_bot_state(key: str, value: str):
+    """Store a bot runtime value."""
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT OR REPLACE INTO bot_state (key, value)
+            VALUES (?, ?)
+        ''', (key, value))
+        conn.commit()
+
+def get_lives_display(lives_left: int) -> str:
+    """Get display string for lives left."""
+    heart_full = "❤️"
+    heart_empty = "🖤"
+    
+    display = ""
+    for i in range(3):
+        if i < lives_left:
+            display += heart_full
+        else:
+            display += heart_empty
+    
+    return display
@@ -0,0 +1,156 @@
+"""
+Update deduplication module
+Drops updates Telegram delivers more than once (after restarts or webhook
+retries) before any handler or database work is done
+"""
+
+import asyncio
+import base64
+import logging
+import struct
+import time
+from typing import Optional
+
+from telegram import Update
+from telegram.ext import Application, ApplicationHandlerStop, ContextTypes, TypeHandler
+
+from database import get_bot_state, set_bot_state
+
+logger = logging.getLogger(__name__)
+
+# Number of most recent update IDs remembered (one bit each)
+WINDOW_SIZE = 8192
+
+# Minimum seconds between two saves of the window while the bot is running
+SAVE_INTERVAL = 5
+
+# Runs before every other handler group
+DEDUP_GROUP = -100
+
+# Telegram restarts update IDs at a random value after a week without
+# updates, so an older window no longer says anything about new IDs
+WINDOW_MAX_AGE = 6 * 24 * 3600
+
+# Serialization format version, written as "<version>:<base64>"
+DUMP_VERSION = '2'
+DUMP_HEADER = struct.Struct('>qd')
+
+class UpdateWindow:
+    """
+    Bitmap of the update IDs seen in a sliding window.
+
+    Covers IDs from base to base + size - 1; bit (update_id % size) is set
+    once the update was seen. IDs just below the window are treated as
+    seen, since Telegram update IDs only grow. An ID more than a window
+    below, or the first ID after WINDOW_MAX_AGE without updates, means
+    Telegram restarted the sequence and the window starts over.
+    """
+
+    def __init__(self, size: int = WINDOW_SIZE):
+        self.size = size
+        self.base = 0
+        self.bits = bytearray(size // 8)
+        # Wall-clock time of the last marked update, kept across restarts
+        self.updated_at = 0.0
+
+    def _reset(self, new_base: int):
+        """Forget all seen IDs and start the window at new_base."""
+        self.bits = bytearray(self.size // 8)
+        self.base = new_base
+
+    def _advance(self, new_base: int):
+        """Slide the window forward, forgetting the IDs that fall out of it."""
+        if new_base - self.base >= self.size:
+            self.bits = bytearray(self.size // 8)
+        else:
+            for update_id in range(self.base, new_base):
+                index = update_id % self.size
+                self.bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        self.base = new_base
+
+    def check_and_mark(self, update_id: int) -> bool:
+        """
+        Mark an update ID as seen.
+
+        Returns:
+            True if the ID is new, False if it is a duplicate
+        """
+        now = time.time()
+        if now - self.updated_at > WINDOW_MAX_AGE or update_id < self.base - self.size:
+            self._reset(update_id)
+        self.updated_at = now
+
+        if update_id < self.base:
+            return False
+
+        if update_id >= self.base + self.size:
+            self._advance(update_id - self.size + 1)
+
+        index = update_id % self.size
+        mask = 1 << (index & 7)
+        if self.bits[index >> 3] & mask:
+            return False
+
+        self.bits[index >> 3] |= mask
+        return True
+
+    def dump(self) -> str:
+        """Serialize the window to a compact string."""
+        raw = DUMP_HEADER.pack(self.base, self.updated_at) + bytes(self.bits)
+        return f"{DUMP_VERSION}:{base64.b64encode(raw).decode('ascii')}"
+
+    @classmethod
+    def load(cls, data: str) -> Optional['UpdateWindow']:
+        """Restore a window serialized with dump(), or None for an older format."""
+        version, _, payload = data.partition(':')
+        if version != DUMP_VERSION:
+            return None
+
+        raw = base64.b64decode(payload)
+        window = cls((len(raw) - DUMP_HEADER.size) * 8)
+        window.base, window.updated_at = DUMP_HEADER.unpack(raw[:DUMP_HEADER.size])
+        window.bits = bytearray(raw[DUMP_HEADER.size:])
+        return window
+
+class UpdateDeduplicator:
+    """Drops duplicate updates using a persisted UpdateWindow per bot."""
+
+    def __init__(self, application: Application, window_size: int = WINDOW_SIZE):
+        self.application = application
+        self.window = UpdateWindow(window_size)
+        self.state_key = None
+        self.dirty = False
+        self.saved_at = time.monotonic()
+
+    def register(self):
+        """Add the deduplication handler in front of all other handlers."""
+        self.application.add_handler(TypeHandler(Update, self.drop_duplicate), group=DEDUP_GROUP)
+
+    async def load(self):
+        """Load the window saved by a previous run of this bot."""
+        self.state_key = f'update_window:{self.application.bot.id}'
+        data = await asyncio.to_thread(get_bot_state, self.state_key)
+        window = UpdateWindow.load(data) if data else None
+        if window is not None:
+            self.window = window
+            logger.info(f"Loaded update window starting at {self.window.base}")
+
+    async def save(self):
+        """Persist the window if it changed since the last save."""
+        if not self.dirty or self.state_key is None:
+            return
+
+        data = self.window.dump()
+        self.dirty = False
+        self.saved_at = time.monotonic()
+        await asyncio.to_thread(set_bot_state, self.state_key, data)
+
+    async def drop_duplicate(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Stop processing of updates that were already seen."""
+        if not self.window.check_and_mark(update.update_id):
+            logger.info("Dropping duplicate update %s", update.update_id)
+            raise ApplicationHandlerStop
+
+        self.dirty = True
+        if time.monotonic() - self.saved_at >= SAVE_INTERVAL:
+            await self.save()
@@ -3,7 +3,9 @@ Telegram bot handlers module
 Contains all message and callback handlers for the quiz bot
 """
 
+import asyncio
 import logging
+from typing import Any, Dict, Optional, Tuple
 from telegram import Update
 from telegram.ext import ContextTypes
 from telegram.constants import ParseMode
@@ -11,12 +13,15 @@ from telegram.constants import ParseMode
 from database import (
     get_user_stats, update_user_info, update_user_quiz_mode,
     record_correct_answer, record_incorrect_answer, clear_quiz_mode,
-    reset_lives, get_lives_display
+    reset_lives, get_lives_display, set_notifications_enabled,
+    start_exam, record_exam_answer, clear_exam
 )
 from quiz_data import (
     get_random_question, validate_answer, get_source_display_name,
-    get_max_question_number
+    get_max_question_number, generate_exam_deck, is_valid_exam_deck, get_exam_question, get_exam_grade
 )
+from adaptive import INITIAL_WEIGHTS
+from i18n import Locale, get_user_locale
 from keyboards import (
     get_main_menu_keyboard, get_quiz_mode_keyboard, get_quiz_control_keyboard,
     get_back_to_main_keyboard, get_continue_or_stop_keyboard, get_game_over_keyboard
@@ -24,6 +29,61 @@ from keyboards import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds between the answer feedback and the next question
+NEXT_QUESTION_DELAY = 1
+
+def pick_next_question(user_id: int, mode: str, stats: Dict[str, Any]) -> Tuple[int, str, str]:
+    """Draw the next question for the user and store it as the current one."""
+    weights = None
+    if mode == 'adaptive':
+        weights = stats['question_weights'] or INITIAL_WEIGHTS
+    
+    question_number, question_text, source = get_random_question(mode, weights)
+    update_user_quiz_mode(user_id, mode, question_number, source)
+    return question_number, question_text, source
+
+def format_question_text(locale: Locale, mode: str, question_text: str, source: str,
+                         progress: Optional[str] = None) -> str:
+    """Build the message text for a quiz question."""
+    quiz_text = locale.question_headers[mode]
+    
+    if progress:
+        quiz_text += locale.text('question_progress', progress=progress)
+    
+    if mode in ('mixed', 'adaptive', 'exam'):
+        quiz_text += locale.text('question_source', source_name=get_source_display_name(source, locale))
+    
+    quiz_text += locale.text('question_prompt', question_text=question_text)
+    return quiz_text
+
+def show_exam_question(locale: Locale, user_id: int, deck: bytes, cursor: int) -> str:
+    """Make the exam question at the cursor current and build its message text."""
+    question_number, question_text, source = get_exam_question(deck, cursor)
+    update_user_quiz_mode(user_id, 'exam', question_number, source)
+    progress = locale.text('exam_progress', current=cursor + 1, total=len(deck))
+    return format_question_text(locale, 'exam', question_text, source, progress)
+
+def format_exam_summary(locale: Locale, exam: Dict[str, Any]) -> str:
+    """Build the graded summary of a finished mock exam."""
+    deck = exam['exam_deck']
+    total = len(deck)
+    correct = exam['exam_correct']
+    
+    missed = []
+    for position in range(total):
+        if exam['exam_mistakes'] >> position & 1:
+            question_number, _, source = get_exam_question(deck, position)
+            missed.append(locale.text('exam_missed_question', number=question_number,
+                                      source=locale.source_short_names[source]))
+    
+    summary_text = locale.text('exam_summary', correct=correct, total=total,
+                               percent=correct / total * 100, grade=get_exam_grade(correct, total))
+    
+    if missed:
+        summary_text += locale.text('exam_missed', questions=', '.join(missed))
+    
+    return summary_text
+
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle the /start command."""
     user = update.effective_user
@@ -31,76 +91,53 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Update user info in database
     update_user_info(user.id, user.username, user.first_name)
     
-    welcome_text = f"""
-🎓 <b>Добро пожаловать в Quiz Bot!</b>
-
-Привет, {user.first_name}! 👋
-
-Этот бот поможет тебе проверить знание номеров экзаменационных вопросов.
-
-<b>Как это работает:</b>
-• Выбираешь режим тестирования
-• Бот показывает вопрос
-• Ты отвечаешь номером вопроса
-• Следишь за своими стриками и рекордами
-
-<b>Режимы тестирования:</b>
-🎓 <b>Специальность</b> - 15 вопросов
-📚 <b>Направление</b> - 30 вопросов  
-🔀 <b>Микс</b> - случайные вопросы из обеих категорий
-
-Удачи в подготовке! 🍀
-"""
+    locale = get_user_locale(user)
+    welcome_text = locale.text('welcome', first_name=user.first_name)
     
     await update.message.reply_text(
         welcome_text,
         parse_mode=ParseMode.HTML,
-        reply_markup=get_main_menu_keyboard()
+        reply_markup=get_main_menu_keyboard(locale)
     )
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle the /help command."""
-    help_text = """
-📖 <b>Помощь по использованию бота</b>
-
-<b>Основные команды:</b>
-/start - Запустить бота
-/help - Показать эту справку
-
-<b>Режимы тестирования:</b>
-🎓 <b>Специальность (15)</b> - Вопросы 1-15 по специальности
-📚 <b>Направление (30)</b> - Вопросы 1-30 по направлению
-🔀 <b>Микс режим</b> - Случайное сочетание вопросов
-
-<b>Как отвечать:</b>
-• Бот показывает текст вопроса
-• Ты пишешь номер этого вопроса (число от 1 до 15/30)
-• При правильном ответе тест продолжается автоматически
-• При неправильном - бот ждет правильный ответ
-
-<b>Статистика:</b>
-📊 Текущий стрик - количество правильных ответов подряд
-🏆 Рекорд - максимальный стрик за все время
-📈 Общая статистика ответов
-
-<b>Управление:</b>
-⏹️ Остановить тест - выйти из режима тестирования
-⬅️ Назад - вернуться в предыдущее меню
-"""
+    locale = get_user_locale(update.effective_user)
+    help_text = locale.text('help')
     
     if update.callback_query:
         await update.callback_query.edit_message_text(
             help_text,
             parse_mode=ParseMode.HTML,
-            reply_markup=get_back_to_main_keyboard()
+            reply_markup=get_back_to_main_keyboard(locale)
         )
     else:
         await update.message.reply_text(
             help_text,
             parse_mode=ParseMode.HTML,
-            reply_markup=get_main_menu_keyboard()
+            reply_markup=get_main_menu_keyboard(locale)
         )
 
+async def reminders_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle the /reminders command - toggle practice reminders."""
+    user_id = update.effective_user.id
+    locale = get_user_locale(update.effective_user)
+    stats = get_user_stats(user_id)
+    
+    enabled = not stats['notifications_enabled']
+    set_notifications_enabled(user_id, enabled)
+    
+    if enabled:
+        reminders_text = locale.text('reminders_on')
+    else:
+        reminders_text = locale.text('reminders_off')
+    
+    await update.message.reply_text(
+        reminders_text,
+        parse_mode=ParseMode.HTML,
+        reply_markup=get_main_menu_keyboard(locale)
+    )
+
 async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle button callbacks."""
     query = update.callback_query
@@ -124,54 +161,37 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await stop_quiz(query)
 
     else:
-        await query.edit_message_text("❌ Неизвестная команда")
+        await query.edit_message_text(get_user_locale(query.from_user).text('unknown_command'))
 
 async def show_main_menu(query):
     """Show the main menu."""
     user = query.from_user
     stats = get_user_stats(user.id)
     
-    menu_text = f"""
-🎓 <b>Quiz Bot - Главное меню</b>
-
-Привет, {user.first_name}! 👋
-
-📊 <b>Твоя статистика:</b>
-🔥 Текущий стрик: <b>{stats['current_streak']}</b>
-🏆 Лучший результат: <b>{stats['best_streak']}</b>
-📈 Правильных ответов: <b>{stats['correct_answers']}</b>/{stats['total_questions']}
-
-Выбери действие:
-"""
+    locale = get_user_locale(user)
+    menu_text = locale.text(
+        'main_menu',
+        first_name=user.first_name,
+        current_streak=stats['current_streak'],
+        best_streak=stats['best_streak'],
+        correct_answers=stats['correct_answers'],
+        total_questions=stats['total_questions']
+    )
     
     await query.edit_message_text(
         menu_text,
         parse_mode=ParseMode.HTML,
-        reply_markup=get_main_menu_keyboard()
+        reply_markup=get_main_menu_keyboard(locale)
     )
 
 async def show_quiz_mode_selection(query):
     """Show quiz mode selection."""
-    mode_text = """
-🎯 <b>Выбор режима тестирования</b>
-
-Выбери режим для проверки знаний:
-
-🎓 <b>Специальность (15)</b>
-   Вопросы 1-15 по специальности
-
-📚 <b>Направление (30)</b>
-   Вопросы 1-30 по направлению
-
-🔀 <b>Микс режим</b>
-   Случайные вопросы из обеих категорий
-   (с указанием источника)
-"""
+    locale = get_user_locale(query.from_user)
     
     await query.edit_message_text(
-        mode_text,
+        locale.text('mode_selection'),
         parse_mode=ParseMode.HTML,
-        reply_markup=get_quiz_mode_keyboard()
+        reply_markup=get_quiz_mode_keyboard(locale)
     )
 
 async def show_statistics(query):
@@ -179,80 +199,132 @@ async def show_statistics(query):
     user_id = query.from_user.id
     stats = get_user_stats(user_id)
     
-    accuracy = 0
-    if stats['total_questions'] > 0:
-        accuracy = (stats['correct_answers'] / stats['total_questions']) * 100
-    
-    stats_text = f"""
-📊 <b>Подробная статистика</b>
-
-👤 <b>Пользователь:</b> {query.from_user.first_name}
-
-🔥 <b>Стрики:</b>
-   • Текущий: <b>{stats['current_streak']}</b>
-   • Рекорд: <b>{stats['best_streak']}</b>
-
-📈 <b>Общие результаты:</b>
-   • Всего вопросов: <b>{stats['total_questions']}</b>
-   • Правильных ответов: <b>{stats['correct_answers']}</b>
-   • Точность: <b>{accuracy:.1f}%</b>
-
-{"🏆 <b>Отличная работа!</b>" if stats['best_streak'] >= 10 else "💪 <b>Продолжай тренироваться!</b>"}
-"""
+    locale = get_user_locale(query.from_user)
+    stats_text = locale.text(
+        'statistics',
+        first_name=query.from_user.first_name,
+        current_streak=stats['current_streak'],
+        best_streak=stats['best_streak'],
+        total_questions=stats['total_questions'],
+        correct_answers=stats['correct_answers'],
+        accuracy=stats['accuracy'],
+        rolling_accuracy=stats['rolling_accuracy'] * 100,
+        verdict=locale.text('statistics_great' if stats['best_streak'] >= 10 else 'statistics_keep_going')
+    )
     
     await query.edit_message_text(
         stats_text,
         parse_mode=ParseMode.HTML,
-        reply_markup=get_back_to_main_keyboard()
+        reply_markup=get_back_to_main_keyboard(locale)
     )
 
 async def start_quiz_mode(query, mode):
     """Start a quiz in the specified mode."""
     user_id = query.from_user.id
+    locale = get_user_locale(query.from_user)
+    
+    if mode == 'exam':
+        await start_exam_mode(query, locale)
+        return
     
     try:
         # Reset lives to 3 when starting a new game
         reset_lives(user_id)
         
-        question_number, question_text, source = get_random_question(mode)
-        update_user_quiz_mode(user_id, mode, question_number, source)
+        question_number, question_text, source = pick_next_question(user_id, mode, get_user_stats(user_id))
+        quiz_text = format_question_text(locale, mode, question_text, source)
         
-        mode_names = {
-            'specialty': '🎓 Специальность (15)',
-            'direction': '📚 Направление (30)',
-            'mixed': '🔀 Микс режим'
-        }
-        
-        quiz_text = f"""
-🎯 <b>Режим:</b> {mode_names[mode]}
-"""
-        
-        if mode == 'mixed':
-            quiz_text += f"📋 <b>Источник:</b> {get_source_display_name(source)}\n"
+        await query.edit_message_text(
+            quiz_text,
+            parse_mode=ParseMode.HTML,
+            reply_markup=get_quiz_control_keyboard(locale)
+        )
         
-        quiz_text += f"""
-❓ <b>{question_text}</b>
+    except Exception as e:
+        logger.error("Error starting quiz: %s", e, extra={'user_id': user_id, 'handler': 'start_quiz_mode'})
+        await query.edit_message_text(
+            locale.text('error_start_quiz'),
+            reply_markup=get_back_to_main_keyboard(locale)
+        )
 
-Введи номер этого вопроса:
-"""
+async def start_exam_mode(query, locale: Locale):
+    """Start a mock exam, or resume the unfinished one."""
+    user_id = query.from_user.id
+    
+    try:
+        stats = get_user_stats(user_id)
+        deck = stats['exam_deck']
+        
+        if is_valid_exam_deck(deck) and stats['exam_cursor'] < len(deck):
+            cursor = stats['exam_cursor']
+        else:
+            deck = generate_exam_deck()
+            cursor = 0
+            start_exam(user_id, deck)
         
         await query.edit_message_text(
-            quiz_text,
+            show_exam_question(locale, user_id, deck, cursor),
             parse_mode=ParseMode.HTML,
-            reply_markup=get_quiz_control_keyboard()
+            reply_markup=get_quiz_control_keyboard(locale)
         )
         
     except Exception as e:
-        logger.error(f"Error starting quiz: {e}")
+        logger.error("Error starting exam: %s", e, extra={'user_id': user_id, 'handler': 'start_exam_mode'})
         await query.edit_message_text(
-            "❌ Ошибка при запуске теста. Попробуй позже.",
-            reply_markup=get_back_to_main_keyboard()
+            locale.text('error_start_exam'),
+            reply_markup=get_back_to_main_keyboard(locale)
         )
 
+async def handle_exam_answer(update: Update, locale: Locale, stats: Dict[str, Any], user_answer: str):
+    """Handle an answer given during a mock exam."""
+    user_id = update.effective_user.id
+    
+    if not is_valid_exam_deck(stats['exam_deck']):
+        # Lost or outdated deck - start a new exam instead of failing on every answer
+        deck = generate_exam_deck()
+        start_exam(user_id, deck)
+        await update.message.reply_text(
+            show_exam_question(locale, user_id, deck, 0),
+            parse_mode=ParseMode.HTML,
+            reply_markup=get_quiz_control_keyboard(locale)
+        )
+        return
+    
+    if validate_answer(user_answer, stats['last_question_number'], stats['last_question_source']):
+        correct = True
+        record_correct_answer(user_id)
+        response_text = locale.text('exam_answer_correct')
+    else:
+        correct = False
+        record_incorrect_answer(user_id, use_lives=False)
+        response_text = locale.text('exam_answer_incorrect', correct_number=stats['last_question_number'])
+    
+    exam = record_exam_answer(user_id, correct)
+    
+    if exam['exam_cursor'] >= len(exam['exam_deck']):
+        response_text += format_exam_summary(locale, exam)
+        clear_exam(user_id)
+        
+        await update.message.reply_text(
+            response_text,
+            parse_mode=ParseMode.HTML,
+            reply_markup=get_game_over_keyboard(locale)
+        )
+        return
+    
+    response_text += show_exam_question(locale, user_id, exam['exam_deck'], exam['exam_cursor'])
+    
+    await update.message.reply_text(
+        response_text,
+        parse_mode=ParseMode.HTML,
+        reply_markup=get_quiz_control_keyboard(locale)
+    )
+
 async def handle_answer(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle user's answer to a quiz question."""
     user_id = update.effective_user.id
     user_answer = update.message.text.strip()
+    locale = get_user_locale(update.effective_user)
     
     stats = get_user_stats(user_id)
     
@@ -266,114 +338,89 @@ async def handle_answer(update: Update, context: ContextTypes.DEFAULT_TYPE):
         max_num = get_max_question_number(stats['last_question_source'])
         if answer_num < 1 or answer_num > max_num:
             await update.message.reply_text(
-                f"❌ Номер вопроса должен быть от 1 до {max_num}",
-                reply_markup=get_quiz_control_keyboard()
+                locale.text('answer_out_of_range', max_number=max_num),
+                reply_markup=get_quiz_control_keyboard(locale)
             )
             return
     except ValueError:
         await update.message.reply_text(
-            "❌ Пожалуйста, введи номер вопроса (число)",
-            reply_markup=get_quiz_control_keyboard()
+            locale.text('answer_not_a_number'),
+            reply_markup=get_quiz_control_keyboard(locale)
         )
         return
     
+    if stats['quiz_mode'] == 'exam':
+        await handle_exam_answer(update, locale, stats, user_answer)
+        return
+    
     # Check if answer is correct
     if validate_answer(user_answer, stats['last_question_number'], stats['last_question_source']):
         # Correct answer
         result = record_correct_answer(user_id)
         
-        response_text = f"✅ <b>Правильно!</b>\n\n"
-        response_text += f"🔥 Стрик: <b>{result['current_streak']}</b>\n"
-        response_text += f"🏆 Рекорд: <b>{result['best_streak']}</b>"
+        response_text = locale.text(
+            'answer_correct',
+            current_streak=result['current_streak'],
+            best_streak=result['best_streak']
+        )
         
         if result['new_record']:
-            response_text += f"\n\n🎉 <b>НОВЫЙ РЕКОРД!</b> 🎉"
+            response_text += locale.text('new_record')
         
         await update.message.reply_text(
             response_text,
             parse_mode=ParseMode.HTML
         )
         
-        # Automatically continue with next question after 1 second
-        import asyncio
-        await asyncio.sleep(1)
+        # Automatically continue with next question after a short pause
+        await asyncio.sleep(NEXT_QUESTION_DELAY)
         
         # Get next question
         user_id = update.effective_user.id
         stats = get_user_stats(user_id)
         
         try:
-            question_number, question_text, source = get_random_question(stats['quiz_mode'])
-            update_user_quiz_mode(user_id, stats['quiz_mode'], question_number, source)
-            
-            mode_names = {
-                'specialty': '🎓 Специальность (15)',
-                'direction': '📚 Направление (30)',
-                'mixed': '🔀 Микс режим'
-            }
-            
-            next_quiz_text = f"""
-🎯 <b>Режим:</b> {mode_names[stats['quiz_mode']]}
-"""
-            
-            if stats['quiz_mode'] == 'mixed':
-                next_quiz_text += f"📋 <b>Источник:</b> {get_source_display_name(source)}\n"
-            
-            next_quiz_text += f"""
-❓ <b>{question_text}</b>
-
-Введи номер этого вопроса:
-"""
+            question_number, question_text, source = pick_next_question(user_id, stats['quiz_mode'], stats)
+            next_quiz_text = format_question_text(locale, stats['quiz_mode'], question_text, source)
             
             await update.message.reply_text(
                 next_quiz_text,
                 parse_mode=ParseMode.HTML,
-                reply_markup=get_quiz_control_keyboard()
+                reply_markup=get_quiz_control_keyboard(locale)
             )
             
         except Exception as e:
-            logger.error(f"Error continuing quiz automatically: {e}")
+            logger.error("Error continuing quiz automatically: %s", e, extra={'user_id': user_id, 'handler': 'handle_answer'})
             await update.message.reply_text(
-                "❌ Ошибка при загрузке следующего вопроса",
-                reply_markup=get_quiz_control_keyboard()
+                locale.text('error_next_question'),
+                reply_markup=get_quiz_control_keyboard(locale)
             )
         
     else:
         # Incorrect answer
         result = record_incorrect_answer(user_id)
         
-        response_text = f"""
-❌ <b>Неправильно!</b>
-
-Правильный ответ: <b>{stats['last_question_number']}</b>
-
-🔥 <b>Жизни:</b> {get_lives_display(result['lives_left'])}
-💔 Стрик сброшен.
-"""
+        response_text = locale.text(
+            'answer_incorrect',
+            correct_number=stats['last_question_number'],
+            lives=get_lives_display(result['lives_left'])
+        )
         
         if result['game_over']:
             # Game Over - show final statistics
             final_stats = get_user_stats(user_id)
-            accuracy = 0
-            if final_stats['total_questions'] > 0:
-                accuracy = (final_stats['correct_answers'] / final_stats['total_questions']) * 100
             
-            response_text += f"""
-
-🎮 <b>ИГРА ОКОНЧЕНА!</b>
-
-📊 <b>Итоговая статистика:</b>
-🔥 Финальный стрик: <b>{final_stats['current_streak']}</b>
-🏆 Лучший результат: <b>{final_stats['best_streak']}</b>
-📈 Точность: <b>{accuracy:.1f}%</b>
-
-Попробуй ещё раз! 💪
-"""
+            response_text += locale.text(
+                'game_over',
+                current_streak=final_stats['current_streak'],
+                best_streak=final_stats['best_streak'],
+                accuracy=final_stats['accuracy']
+            )
             
             await update.message.reply_text(
                 response_text,
                 parse_mode=ParseMode.HTML,
-                reply_markup=get_game_over_keyboard()
+                reply_markup=get_game_over_keyboard(locale)
             )
             
             # Clear quiz mode
@@ -384,47 +431,27 @@ async def handle_answer(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 parse_mode=ParseMode.HTML
             )
             
-            # Automatically continue with next question after 1 second
-            import asyncio
-            await asyncio.sleep(1)
+            # Automatically continue with next question after a short pause
+            await asyncio.sleep(NEXT_QUESTION_DELAY)
             
             # Get next question
             stats = get_user_stats(user_id)
             
             try:
-                question_number, question_text, source = get_random_question(stats['quiz_mode'])
-                update_user_quiz_mode(user_id, stats['quiz_mode'], question_number, source)
-                
-                mode_names = {
-                    'specialty': '🎓 Специальность (15)',
-                    'direction': '📚 Направление (30)',
-                    'mixed': '🔀 Микс режим'
-                }
-                
-                next_quiz_text = f"""
-🎯 <b>Режим:</b> {mode_names[stats['quiz_mode']]}
-"""
-                
-                if stats['quiz_mode'] == 'mixed':
-                    next_quiz_text += f"📋 <b>Источник:</b> {get_source_display_name(source)}\n"
-                
-                next_quiz_text += f"""
-❓ <b>{question_text}</b>
-
-Введи номер этого вопроса:
-"""
+                question_number, question_text, source = pick_next_question(user_id, stats['quiz_mode'], stats)
+                next_quiz_text = format_question_text(locale, stats['quiz_mode'], question_text, source)
                 
                 await update.message.reply_text(
                     next_quiz_text,
                     parse_mode=ParseMode.HTML,
-                    reply_markup=get_quiz_control_keyboard()
+                    reply_markup=get_quiz_control_keyboard(locale)
                 )
                 
             except Exception as e:
-                logger.error(f"Error continuing quiz automatically: {e}")
+                logger.error("Error continuing quiz automatically: %s", e, extra={'user_id': user_id, 'handler': 'handle_answer'})
                 await update.message.reply_text(
-                    "❌ Ошибка при загрузке следующего вопроса",
-                    reply_markup=get_quiz_control_keyboard()
+                    locale.text('error_next_question'),
+                    reply_markup=get_quiz_control_keyboard(locale)
                 )
 
 
@@ -435,29 +462,36 @@ async def stop_quiz(query):
     clear_quiz_mode(user_id)
     
     stats = get_user_stats(user_id)
+    locale = get_user_locale(query.from_user)
     
-    stop_text = f"""
-⏹️ <b>Тест остановлен</b>
-
-📊 <b>Твои результаты:</b>
-🔥 Текущий стрик: <b>{stats['current_streak']}</b>
-🏆 Лучший результат: <b>{stats['best_streak']}</b>
-
-Спасибо за тренировку! 💪
-"""
+    stop_text = locale.text(
+        'quiz_stopped',
+        current_streak=stats['current_streak'],
+        best_streak=stats['best_streak']
+    )
+    
+    if is_valid_exam_deck(stats['exam_deck']) and stats['exam_cursor'] < len(stats['exam_deck']):
+        stop_text += locale.text('exam_saved')
     
     await query.edit_message_text(
         stop_text,
         parse_mode=ParseMode.HTML,
-        reply_markup=get_main_menu_keyboard()
+        reply_markup=get_main_menu_keyboard(locale)
     )
 
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle errors."""
-    logger.error(f"Update {update} caused error {context.error}")
+    # Only the update ID is logged - formatting whole Update objects is expensive
+    user = getattr(update, 'effective_user', None)
+    logger.error(
+        "Update %s caused error %s", getattr(update, 'update_id', None), context.error,
+        exc_info=context.error,
+        extra={'user_id': user.id if user else None, 'handler': 'error_handler'}
+    )
     
     if update.effective_message:
+        locale = get_user_locale(user)
         await update.effective_message.reply_text(
-            "❌ Произошла ошибка. Попробуй позже.",
-            reply_markup=get_main_menu_keyboard()
+            locale.text('error_generic'),
+            reply_markup=get_main_menu_keyboard(locale)
         )
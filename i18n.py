@@ -0,0 +1,116 @@
+"""
+Localization module
+Compiles the message catalogs in locales/ once at startup and picks the
+catalog for each user from their Telegram language_code.
+
+Compiling a locale fills in missing keys from the default catalog, interns
+every template, renders the question headers of each quiz mode and builds
+all inline keyboards, so a request only does dictionary lookups and the
+str.format() of its own values.
+"""
+
+import importlib
+import logging
+import sys
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from keyboards import build_keyboards
+
+logger = logging.getLogger(__name__)
+
+# Catalog modules in locales/, the first one is the default and the fallback
+SUPPORTED_LOCALES = ('ru', 'en', 'pl')
+DEFAULT_LOCALE = SUPPORTED_LOCALES[0]
+
+# Maximum number of users whose locale is kept in memory
+LOCALE_CACHE_SIZE = 10000
+
+class Locale:
+    """Compiled message catalog of one language."""
+
+    def __init__(self, code: str, messages: Dict[str, str]):
+        self.code = code
+        self.messages = {key: sys.intern(text) for key, text in messages.items()}
+        self.mode_names = self._section('mode.')
+        self.source_names = self._section('source.')
+        self.source_short_names = self._section('source_short.')
+        self.question_headers = {
+            mode: self.text('question_mode', mode_name=name)
+            for mode, name in self.mode_names.items()
+        }
+        self.keyboards = build_keyboards(self.messages)
+
+    def _section(self, prefix: str) -> Dict[str, str]:
+        """Get the messages whose keys start with prefix, keyed by the rest."""
+        return {
+            key[len(prefix):]: text
+            for key, text in self.messages.items() if key.startswith(prefix)
+        }
+
+    def text(self, key: str, **values) -> str:
+        """
+        Get a message, filling in its placeholders.
+
+        Args:
+            key: Message key in the catalog
+            **values: Values for the {placeholders} of the template
+
+        Returns:
+            The formatted message
+        """
+        template = self.messages[key]
+        return template.format(**values) if values else template
+
+def compile_locales() -> Dict[str, Locale]:
+    """Load and compile all catalogs, falling back to the default one for missing keys."""
+    default_messages = importlib.import_module(f'locales.{DEFAULT_LOCALE}').MESSAGES
+    locales = {}
+
+    for code in SUPPORTED_LOCALES:
+        messages = importlib.import_module(f'locales.{code}').MESSAGES
+        missing = default_messages.keys() - messages.keys()
+        if missing:
+            logger.warning(f"Locale {code} is missing {len(missing)} messages: {', '.join(sorted(missing))}")
+        locales[code] = Locale(code, {**default_messages, **messages})
+
+    return locales
+
+LOCALES = compile_locales()
+
+# user_id -> (language_code, locale), least recently used first
+_user_locales: 'OrderedDict[int, Tuple[Optional[str], Locale]]' = OrderedDict()
+
+def get_locale(language_code: Optional[str] = None) -> Locale:
+    """
+    Get the compiled locale for a Telegram language code.
+
+    Regional variants use their base language ('en-GB' -> 'en'); unknown or
+    missing codes get the default locale.
+    """
+    if language_code:
+        locale = LOCALES.get(language_code.split('-', 1)[0].lower())
+        if locale is not None:
+            return locale
+    return LOCALES[DEFAULT_LOCALE]
+
+def get_user_locale(user) -> Locale:
+    """
+    Get the locale of a Telegram user, cached per user ID.
+
+    The cache entry is refreshed when the user's language_code changes.
+    """
+    if user is None:
+        return LOCALES[DEFAULT_LOCALE]
+
+    cached = _user_locales.get(user.id)
+    if cached is not None and cached[0] == user.language_code:
+        _user_locales.move_to_end(user.id)
+        return cached[1]
+
+    locale = get_locale(user.language_code)
+    _user_locales[user.id] = (user.language_code, locale)
+    _user_locales.move_to_end(user.id)
+    if len(_user_locales) > LOCALE_CACHE_SIZE:
+        _user_locales.popitem(last=False)
+    return locale
@@ -1,58 +1,79 @@
 """
 Telegram inline keyboards module
 Contains all keyboard layouts for the bot interface
+
+Keyboards are built once per locale by i18n at startup; the getters below
+only look up the prebuilt markup of the user's locale.
 """
 
+from typing import Dict
+
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
-def get_main_menu_keyboard():
+# Keyboard name -> rows of (message key, callback data)
+KEYBOARD_LAYOUTS = {
+    'main_menu': [
+        [('button.start_quiz', 'start_quiz')],
+        [('button.statistics', 'statistics')],
+        [('button.help', 'help')]
+    ],
+    'quiz_mode': [
+        [('mode.specialty', 'mode_specialty')],
+        [('mode.direction', 'mode_direction')],
+        [('mode.mixed', 'mode_mixed')],
+        [('mode.adaptive', 'mode_adaptive')],
+        [('mode.exam', 'mode_exam')],
+        [('button.back', 'back_to_main')]
+    ],
+    'quiz_control': [
+        [('button.stop_quiz', 'stop_quiz')],
+        [('button.main_menu', 'back_to_main')]
+    ],
+    'back_to_main': [
+        [('button.main_menu', 'back_to_main')]
+    ],
+    'continue_or_stop': [
+        [('button.continue', 'continue_quiz')],
+        [('button.stop_quiz', 'stop_quiz')],
+        [('button.main_menu', 'back_to_main')]
+    ],
+    'game_over': [
+        [('button.play_again', 'start_quiz')],
+        [('button.statistics', 'statistics')],
+        [('button.main_menu', 'back_to_main')]
+    ],
+}
+
+def build_keyboards(messages: Dict[str, str]) -> Dict[str, InlineKeyboardMarkup]:
+    """Build every keyboard layout with the button labels of one catalog."""
+    return {
+        name: InlineKeyboardMarkup([
+            [InlineKeyboardButton(messages[key], callback_data=data) for key, data in row]
+            for row in rows
+        ])
+        for name, rows in KEYBOARD_LAYOUTS.items()
+    }
+
+def get_main_menu_keyboard(locale):
     """Get the main menu keyboard."""
-    keyboard = [
-        [InlineKeyboardButton("🎯 Начать тест", callback_data="start_quiz")],
-        [InlineKeyboardButton("📊 Статистика", callback_data="statistics")],
-        [InlineKeyboardButton("ℹ️ Помощь", callback_data="help")]
-    ]
-    return InlineKeyboardMarkup(keyboard)
-
-def get_quiz_mode_keyboard():
+    return locale.keyboards['main_menu']
+
+def get_quiz_mode_keyboard(locale):
     """Get the quiz mode selection keyboard."""
-    keyboard = [
-        [InlineKeyboardButton("🎓 Специальность (15)", callback_data="mode_specialty")],
-        [InlineKeyboardButton("📚 Направление (30)", callback_data="mode_direction")],
-        [InlineKeyboardButton("🔀 Микс режим", callback_data="mode_mixed")],
-        [InlineKeyboardButton("⬅️ Назад", callback_data="back_to_main")]
-    ]
-    return InlineKeyboardMarkup(keyboard)
-
-def get_quiz_control_keyboard():
+    return locale.keyboards['quiz_mode']
+
+def get_quiz_control_keyboard(locale):
     """Get the quiz control keyboard (shown during active quiz)."""
-    keyboard = [
-        [InlineKeyboardButton("⏹️ Остановить тест", callback_data="stop_quiz")],
-        [InlineKeyboardButton("⬅️ Главное меню", callback_data="back_to_main")]
-    ]
-    return InlineKeyboardMarkup(keyboard)
+    return locale.keyboards['quiz_control']
 
-def get_back_to_main_keyboard():
+def get_back_to_main_keyboard(locale):
     """Get a simple back to main menu keyboard."""
-    keyboard = [
-        [InlineKeyboardButton("⬅️ Главное меню", callback_data="back_to_main")]
-    ]
-    return InlineKeyboardMarkup(keyboard)
+    return locale.keyboards['back_to_main']
 
-def get_continue_or_stop_keyboard():
+def get_continue_or_stop_keyboard(locale):
     """Get keyboard for continue or stop options."""
-    keyboard = [
-        [InlineKeyboardButton("➡️ Продолжить", callback_data="continue_quiz")],
-        [InlineKeyboardButton("⏹️ Остановить тест", callback_data="stop_quiz")],
-        [InlineKeyboardButton("⬅️ Главное меню", callback_data="back_to_main")]
-    ]
-    return InlineKeyboardMarkup(keyboard)
-
-def get_game_over_keyboard():
+    return locale.keyboards['continue_or_stop']
+
+def get_game_over_keyboard(locale):
     """Get keyboard for game over screen."""
-    keyboard = [
-        [InlineKeyboardButton("🎯 Играть заново", callback_data="start_quiz")],
-        [InlineKeyboardButton("📊 Статистика", callback_data="statistics")],
-        [InlineKeyboardButton("⬅️ Главное меню", callback_data="back_to_main")]
-    ]
-    return InlineKeyboardMarkup(keyboard)
+    return locale.keyboards['game_over']
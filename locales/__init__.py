@@ -0,0 +1,4 @@
+"""
+Message catalogs, one module per language with a MESSAGES dict.
+Add a language by adding its module and listing it in i18n.SUPPORTED_LOCALES.
+"""
@@ -0,0 +1,212 @@
+"""
+English message catalog
+"""
+
+MESSAGES = {
+    # Quiz modes and question sources
+    'mode.specialty': '🎓 Specialty (15)',
+    'mode.direction': '📚 Field of study (30)',
+    'mode.mixed': '🔀 Mixed mode',
+    'mode.adaptive': '🧠 Adaptive mode',
+    'mode.exam': '📝 Mock exam',
+
+    'source.specialty': 'Specialty (15 questions)',
+    'source.direction': 'Field of study (30 questions)',
+    'source.unknown': 'Unknown source',
+
+    'source_short.specialty': 'Spec.',
+    'source_short.direction': 'Field',
+
+    # Keyboard buttons
+    'button.start_quiz': '🎯 Start quiz',
+    'button.statistics': '📊 Statistics',
+    'button.help': 'ℹ️ Help',
+    'button.back': '⬅️ Back',
+    'button.stop_quiz': '⏹️ Stop quiz',
+    'button.main_menu': '⬅️ Main menu',
+    'button.continue': '➡️ Continue',
+    'button.play_again': '🎯 Play again',
+
+    # Commands and menus
+    'welcome': """
+🎓 <b>Welcome to Quiz Bot!</b>
+
+Hi, {first_name}! 👋
+
+This bot helps you learn the numbers of the exam questions.
+
+<b>How it works:</b>
+• Choose a quiz mode
+• The bot shows a question
+• You answer with the question number
+• Keep track of your streaks and records
+
+<b>Quiz modes:</b>
+🎓 <b>Specialty</b> - 15 questions
+📚 <b>Field of study</b> - 30 questions
+🔀 <b>Mixed</b> - random questions from both lists
+🧠 <b>Adaptive</b> - questions matched to your level
+📝 <b>Mock exam</b> - 20 graded questions
+
+Good luck with your preparation! 🍀
+""",
+
+    'help': """
+📖 <b>How to use the bot</b>
+
+<b>Commands:</b>
+/start - Start the bot
+/help - Show this help
+/reminders - Turn reminders on/off
+
+<b>Quiz modes:</b>
+🎓 <b>Specialty (15)</b> - Specialty questions 1-15
+📚 <b>Field of study (30)</b> - Field of study questions 1-30
+🔀 <b>Mixed mode</b> - A random mix of questions
+🧠 <b>Adaptive mode</b> - Asks mastered questions less often
+📝 <b>Mock exam</b> - 20 questions without repeats, graded at the end
+
+<b>How to answer:</b>
+• The bot shows the text of a question
+• You type its number (from 1 to 15/30)
+• After a correct answer the quiz continues automatically
+• After a wrong one the bot shows the correct answer
+
+<b>Statistics:</b>
+📊 Current streak - correct answers in a row
+🏆 Record - your longest streak ever
+📈 Overall answer statistics
+
+<b>Controls:</b>
+⏹️ Stop quiz - leave the quiz
+⬅️ Back - return to the previous menu
+""",
+
+    'reminders_on': "🔔 <b>Reminders are on</b>\n\nSend /reminders to turn them off.",
+    'reminders_off': "🔕 <b>Reminders are off</b>\n\nSend /reminders to turn them back on.",
+
+    'unknown_command': "❌ Unknown command",
+
+    'main_menu': """
+🎓 <b>Quiz Bot - Main menu</b>
+
+Hi, {first_name}! 👋
+
+📊 <b>Your statistics:</b>
+🔥 Current streak: <b>{current_streak}</b>
+🏆 Best result: <b>{best_streak}</b>
+📈 Correct answers: <b>{correct_answers}</b>/{total_questions}
+
+Choose an action:
+""",
+
+    'mode_selection': """
+🎯 <b>Choose a quiz mode</b>
+
+Pick how you want to practice:
+
+🎓 <b>Specialty (15)</b>
+   Specialty questions 1-15
+
+📚 <b>Field of study (30)</b>
+   Field of study questions 1-30
+
+🔀 <b>Mixed mode</b>
+   Random questions from both lists
+   (with the source shown)
+
+🧠 <b>Adaptive mode</b>
+   Asks the questions you already know
+   well less often and spends the time
+   on the rest
+
+📝 <b>Mock exam</b>
+   20 questions without repeats, graded
+   at the end, no lives lost
+""",
+
+    'statistics': """
+📊 <b>Detailed statistics</b>
+
+👤 <b>User:</b> {first_name}
+
+🔥 <b>Streaks:</b>
+   • Current: <b>{current_streak}</b>
+   • Record: <b>{best_streak}</b>
+
+📈 <b>Overall results:</b>
+   • Questions answered: <b>{total_questions}</b>
+   • Correct answers: <b>{correct_answers}</b>
+   • Accuracy: <b>{accuracy:.1f}%</b>
+   • Recent accuracy: <b>{rolling_accuracy:.0f}%</b>
+
+{verdict}
+""",
+    'statistics_great': "🏆 <b>Great job!</b>",
+    'statistics_keep_going': "💪 <b>Keep practicing!</b>",
+
+    # Questions
+    'question_mode': "\n🎯 <b>Mode:</b> {mode_name}\n",
+    'question_progress': "🔢 <b>Question:</b> {progress}\n",
+    'question_source': "📋 <b>Source:</b> {source_name}\n",
+    'question_prompt': "\n❓ <b>{question_text}</b>\n\nEnter the number of this question:\n",
+
+    'answer_out_of_range': "❌ The question number must be between 1 and {max_number}",
+    'answer_not_a_number': "❌ Please enter the question number (a number)",
+
+    'answer_correct': "✅ <b>Correct!</b>\n\n🔥 Streak: <b>{current_streak}</b>\n🏆 Record: <b>{best_streak}</b>",
+    'new_record': "\n\n🎉 <b>NEW RECORD!</b> 🎉",
+
+    'answer_incorrect': """
+❌ <b>Wrong!</b>
+
+Correct answer: <b>{correct_number}</b>
+
+🔥 <b>Lives:</b> {lives}
+💔 Streak reset.
+""",
+
+    'game_over': """
+
+🎮 <b>GAME OVER!</b>
+
+📊 <b>Final statistics:</b>
+🔥 Final streak: <b>{current_streak}</b>
+🏆 Best result: <b>{best_streak}</b>
+📈 Accuracy: <b>{accuracy:.1f}%</b>
+
+Try again! 💪
+""",
+
+    'quiz_stopped': """
+⏹️ <b>Quiz stopped</b>
+
+📊 <b>Your results:</b>
+🔥 Current streak: <b>{current_streak}</b>
+🏆 Best result: <b>{best_streak}</b>
+
+Thanks for practicing! 💪
+""",
+
+    # Mock exam
+    'exam_progress': "{current} of {total}",
+    'exam_answer_correct': "✅ <b>Correct!</b>\n",
+    'exam_answer_incorrect': "❌ <b>Wrong!</b> Correct answer: <b>{correct_number}</b>\n",
+
+    'exam_summary': """
+
+📝 <b>EXAM FINISHED!</b>
+
+✅ Correct answers: <b>{correct}</b> of {total} ({percent:.0f}%)
+🎓 Grade: <b>{grade}</b>
+""",
+    'exam_missed': "\n📚 <b>Review these questions:</b> {questions}\n",
+    'exam_missed_question': "#{number} ({source})",
+    'exam_saved': "\n📝 Your exam progress is saved - you can continue it later.\n",
+
+    # Errors
+    'error_start_quiz': "❌ Could not start the quiz. Please try again later.",
+    'error_start_exam': "❌ Could not start the exam. Please try again later.",
+    'error_next_question': "❌ Could not load the next question",
+    'error_generic': "❌ Something went wrong. Please try again later.",
+}
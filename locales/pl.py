@@ -0,0 +1,212 @@
+"""
+Polish message catalog
+"""
+
+MESSAGES = {
+    # Quiz modes and question sources
+    'mode.specialty': '🎓 Specjalność (15)',
+    'mode.direction': '📚 Kierunek (30)',
+    'mode.mixed': '🔀 Tryb mieszany',
+    'mode.adaptive': '🧠 Tryb adaptacyjny',
+    'mode.exam': '📝 Egzamin próbny',
+
+    'source.specialty': 'Specjalność (15 pytań)',
+    'source.direction': 'Kierunek (30 pytań)',
+    'source.unknown': 'Nieznane źródło',
+
+    'source_short.specialty': 'Spec.',
+    'source_short.direction': 'Kier.',
+
+    # Keyboard buttons
+    'button.start_quiz': '🎯 Rozpocznij test',
+    'button.statistics': '📊 Statystyki',
+    'button.help': 'ℹ️ Pomoc',
+    'button.back': '⬅️ Wstecz',
+    'button.stop_quiz': '⏹️ Zakończ test',
+    'button.main_menu': '⬅️ Menu główne',
+    'button.continue': '➡️ Dalej',
+    'button.play_again': '🎯 Zagraj ponownie',
+
+    # Commands and menus
+    'welcome': """
+🎓 <b>Witaj w Quiz Bot!</b>
+
+Cześć, {first_name}! 👋
+
+Ten bot pomoże Ci sprawdzić znajomość numerów pytań egzaminacyjnych.
+
+<b>Jak to działa:</b>
+• Wybierasz tryb testu
+• Bot pokazuje pytanie
+• Odpowiadasz numerem pytania
+• Śledzisz swoje serie i rekordy
+
+<b>Tryby testu:</b>
+🎓 <b>Specjalność</b> - 15 pytań
+📚 <b>Kierunek</b> - 30 pytań
+🔀 <b>Mieszany</b> - losowe pytania z obu list
+🧠 <b>Adaptacyjny</b> - pytania dopasowane do Twojego poziomu
+📝 <b>Egzamin próbny</b> - 20 pytań z oceną
+
+Powodzenia w nauce! 🍀
+""",
+
+    'help': """
+📖 <b>Jak korzystać z bota</b>
+
+<b>Komendy:</b>
+/start - Uruchom bota
+/help - Pokaż tę pomoc
+/reminders - Włącz/wyłącz przypomnienia
+
+<b>Tryby testu:</b>
+🎓 <b>Specjalność (15)</b> - Pytania 1-15 ze specjalności
+📚 <b>Kierunek (30)</b> - Pytania 1-30 z kierunku
+🔀 <b>Tryb mieszany</b> - Losowa mieszanka pytań
+🧠 <b>Tryb adaptacyjny</b> - Opanowane pytania pojawiają się rzadziej
+📝 <b>Egzamin próbny</b> - 20 pytań bez powtórzeń z oceną
+
+<b>Jak odpowiadać:</b>
+• Bot pokazuje treść pytania
+• Wpisujesz jego numer (liczba od 1 do 15/30)
+• Po poprawnej odpowiedzi test toczy się dalej automatycznie
+• Po błędnej bot pokazuje poprawną odpowiedź
+
+<b>Statystyki:</b>
+📊 Aktualna seria - poprawne odpowiedzi z rzędu
+🏆 Rekord - najdłuższa seria w historii
+📈 Ogólne statystyki odpowiedzi
+
+<b>Sterowanie:</b>
+⏹️ Zakończ test - wyjdź z trybu testu
+⬅️ Wstecz - wróć do poprzedniego menu
+""",
+
+    'reminders_on': "🔔 <b>Przypomnienia włączone</b>\n\nWyślij /reminders, aby je wyłączyć.",
+    'reminders_off': "🔕 <b>Przypomnienia wyłączone</b>\n\nWyślij /reminders, aby je ponownie włączyć.",
+
+    'unknown_command': "❌ Nieznana komenda",
+
+    'main_menu': """
+🎓 <b>Quiz Bot - Menu główne</b>
+
+Cześć, {first_name}! 👋
+
+📊 <b>Twoje statystyki:</b>
+🔥 Aktualna seria: <b>{current_streak}</b>
+🏆 Najlepszy wynik: <b>{best_streak}</b>
+📈 Poprawne odpowiedzi: <b>{correct_answers}</b>/{total_questions}
+
+Wybierz działanie:
+""",
+
+    'mode_selection': """
+🎯 <b>Wybór trybu testu</b>
+
+Wybierz, jak chcesz ćwiczyć:
+
+🎓 <b>Specjalność (15)</b>
+   Pytania 1-15 ze specjalności
+
+📚 <b>Kierunek (30)</b>
+   Pytania 1-30 z kierunku
+
+🔀 <b>Tryb mieszany</b>
+   Losowe pytania z obu list
+   (z podaniem źródła)
+
+🧠 <b>Tryb adaptacyjny</b>
+   Rzadziej pyta o pytania, które już
+   dobrze znasz, i więcej czasu
+   poświęca pozostałym
+
+📝 <b>Egzamin próbny</b>
+   20 pytań bez powtórzeń z oceną
+   na końcu, bez utraty żyć
+""",
+
+    'statistics': """
+📊 <b>Szczegółowe statystyki</b>
+
+👤 <b>Użytkownik:</b> {first_name}
+
+🔥 <b>Serie:</b>
+   • Aktualna: <b>{current_streak}</b>
+   • Rekord: <b>{best_streak}</b>
+
+📈 <b>Wyniki ogólne:</b>
+   • Wszystkich pytań: <b>{total_questions}</b>
+   • Poprawnych odpowiedzi: <b>{correct_answers}</b>
+   • Skuteczność: <b>{accuracy:.1f}%</b>
+   • Skuteczność w ostatnich odpowiedziach: <b>{rolling_accuracy:.0f}%</b>
+
+{verdict}
+""",
+    'statistics_great': "🏆 <b>Świetna robota!</b>",
+    'statistics_keep_going': "💪 <b>Ćwicz dalej!</b>",
+
+    # Questions
+    'question_mode': "\n🎯 <b>Tryb:</b> {mode_name}\n",
+    'question_progress': "🔢 <b>Pytanie:</b> {progress}\n",
+    'question_source': "📋 <b>Źródło:</b> {source_name}\n",
+    'question_prompt': "\n❓ <b>{question_text}</b>\n\nPodaj numer tego pytania:\n",
+
+    'answer_out_of_range': "❌ Numer pytania musi być od 1 do {max_number}",
+    'answer_not_a_number': "❌ Podaj numer pytania (liczbę)",
+
+    'answer_correct': "✅ <b>Dobrze!</b>\n\n🔥 Seria: <b>{current_streak}</b>\n🏆 Rekord: <b>{best_streak}</b>",
+    'new_record': "\n\n🎉 <b>NOWY REKORD!</b> 🎉",
+
+    'answer_incorrect': """
+❌ <b>Źle!</b>
+
+Poprawna odpowiedź: <b>{correct_number}</b>
+
+🔥 <b>Życia:</b> {lives}
+💔 Seria wyzerowana.
+""",
+
+    'game_over': """
+
+🎮 <b>KONIEC GRY!</b>
+
+📊 <b>Statystyki końcowe:</b>
+🔥 Końcowa seria: <b>{current_streak}</b>
+🏆 Najlepszy wynik: <b>{best_streak}</b>
+📈 Skuteczność: <b>{accuracy:.1f}%</b>
+
+Spróbuj jeszcze raz! 💪
+""",
+
+    'quiz_stopped': """
+⏹️ <b>Test zakończony</b>
+
+📊 <b>Twoje wyniki:</b>
+🔥 Aktualna seria: <b>{current_streak}</b>
+🏆 Najlepszy wynik: <b>{best_streak}</b>
+
+Dzięki za trening! 💪
+""",
+
+    # Mock exam
+    'exam_progress': "{current} z {total}",
+    'exam_answer_correct': "✅ <b>Dobrze!</b>\n",
+    'exam_answer_incorrect': "❌ <b>Źle!</b> Poprawna odpowiedź: <b>{correct_number}</b>\n",
+
+    'exam_summary': """
+
+📝 <b>EGZAMIN ZAKOŃCZONY!</b>
+
+✅ Poprawne odpowiedzi: <b>{correct}</b> z {total} ({percent:.0f}%)
+🎓 Ocena: <b>{grade}</b>
+""",
+    'exam_missed': "\n📚 <b>Powtórz pytania:</b> {questions}\n",
+    'exam_missed_question': "nr {number} ({source})",
+    'exam_saved': "\n📝 Postęp egzaminu został zapisany - możesz go dokończyć później.\n",
+
+    # Errors
+    'error_start_quiz': "❌ Nie udało się rozpocząć testu. Spróbuj później.",
+    'error_start_exam': "❌ Nie udało się rozpocząć egzaminu. Spróbuj później.",
+    'error_next_question': "❌ Nie udało się wczytać następnego pytania",
+    'error_generic': "❌ Wystąpił błąd. Spróbuj później.",
+}
@@ -0,0 +1,213 @@
+"""
+Russian message catalog (default locale)
+Every other catalog falls back to these texts for keys it does not define
+"""
+
+MESSAGES = {
+    # Quiz modes and question sources
+    'mode.specialty': '🎓 Специальность (15)',
+    'mode.direction': '📚 Направление (30)',
+    'mode.mixed': '🔀 Микс режим',
+    'mode.adaptive': '🧠 Адаптивный режим',
+    'mode.exam': '📝 Пробный экзамен',
+
+    'source.specialty': 'Специальность (15 вопросов)',
+    'source.direction': 'Направление (30 вопросов)',
+    'source.unknown': 'Неизвестный источник',
+
+    'source_short.specialty': 'Спец.',
+    'source_short.direction': 'Напр.',
+
+    # Keyboard buttons
+    'button.start_quiz': '🎯 Начать тест',
+    'button.statistics': '📊 Статистика',
+    'button.help': 'ℹ️ Помощь',
+    'button.back': '⬅️ Назад',
+    'button.stop_quiz': '⏹️ Остановить тест',
+    'button.main_menu': '⬅️ Главное меню',
+    'button.continue': '➡️ Продолжить',
+    'button.play_again': '🎯 Играть заново',
+
+    # Commands and menus
+    'welcome': """
+🎓 <b>Добро пожаловать в Quiz Bot!</b>
+
+Привет, {first_name}! 👋
+
+Этот бот поможет тебе проверить знание номеров экзаменационных вопросов.
+
+<b>Как это работает:</b>
+• Выбираешь режим тестирования
+• Бот показывает вопрос
+• Ты отвечаешь номером вопроса
+• Следишь за своими стриками и рекордами
+
+<b>Режимы тестирования:</b>
+🎓 <b>Специальность</b> - 15 вопросов
+📚 <b>Направление</b> - 30 вопросов
+🔀 <b>Микс</b> - случайные вопросы из обеих категорий
+🧠 <b>Адаптивный</b> - вопросы под твой уровень
+📝 <b>Пробный экзамен</b> - 20 вопросов с оценкой
+
+Удачи в подготовке! 🍀
+""",
+
+    'help': """
+📖 <b>Помощь по использованию бота</b>
+
+<b>Основные команды:</b>
+/start - Запустить бота
+/help - Показать эту справку
+/reminders - Включить/отключить напоминания
+
+<b>Режимы тестирования:</b>
+🎓 <b>Специальность (15)</b> - Вопросы 1-15 по специальности
+📚 <b>Направление (30)</b> - Вопросы 1-30 по направлению
+🔀 <b>Микс режим</b> - Случайное сочетание вопросов
+🧠 <b>Адаптивный режим</b> - Выученные вопросы выпадают реже
+📝 <b>Пробный экзамен</b> - 20 вопросов без повторов с оценкой
+
+<b>Как отвечать:</b>
+• Бот показывает текст вопроса
+• Ты пишешь номер этого вопроса (число от 1 до 15/30)
+• При правильном ответе тест продолжается автоматически
+• При неправильном - бот ждет правильный ответ
+
+<b>Статистика:</b>
+📊 Текущий стрик - количество правильных ответов подряд
+🏆 Рекорд - максимальный стрик за все время
+📈 Общая статистика ответов
+
+<b>Управление:</b>
+⏹️ Остановить тест - выйти из режима тестирования
+⬅️ Назад - вернуться в предыдущее меню
+""",
+
+    'reminders_on': "🔔 <b>Напоминания включены</b>\n\nОтправь /reminders, чтобы отключить их.",
+    'reminders_off': "🔕 <b>Напоминания отключены</b>\n\nОтправь /reminders, чтобы включить их снова.",
+
+    'unknown_command': "❌ Неизвестная команда",
+
+    'main_menu': """
+🎓 <b>Quiz Bot - Главное меню</b>
+
+Привет, {first_name}! 👋
+
+📊 <b>Твоя статистика:</b>
+🔥 Текущий стрик: <b>{current_streak}</b>
+🏆 Лучший результат: <b>{best_streak}</b>
+📈 Правильных ответов: <b>{correct_answers}</b>/{total_questions}
+
+Выбери действие:
+""",
+
+    'mode_selection': """
+🎯 <b>Выбор режима тестирования</b>
+
+Выбери режим для проверки знаний:
+
+🎓 <b>Специальность (15)</b>
+   Вопросы 1-15 по специальности
+
+📚 <b>Направление (30)</b>
+   Вопросы 1-30 по направлению
+
+🔀 <b>Микс режим</b>
+   Случайные вопросы из обеих категорий
+   (с указанием источника)
+
+🧠 <b>Адаптивный режим</b>
+   Реже спрашивает вопросы, которые ты
+   уже уверенно знаешь, и больше
+   тренирует остальные
+
+📝 <b>Пробный экзамен</b>
+   20 вопросов без повторов с оценкой
+   в конце, без потери жизней
+""",
+
+    'statistics': """
+📊 <b>Подробная статистика</b>
+
+👤 <b>Пользователь:</b> {first_name}
+
+🔥 <b>Стрики:</b>
+   • Текущий: <b>{current_streak}</b>
+   • Рекорд: <b>{best_streak}</b>
+
+📈 <b>Общие результаты:</b>
+   • Всего вопросов: <b>{total_questions}</b>
+   • Правильных ответов: <b>{correct_answers}</b>
+   • Точность: <b>{accuracy:.1f}%</b>
+   • Точность за последние ответы: <b>{rolling_accuracy:.0f}%</b>
+
+{verdict}
+""",
+    'statistics_great': "🏆 <b>Отличная работа!</b>",
+    'statistics_keep_going': "💪 <b>Продолжай тренироваться!</b>",
+
+    # Questions
+    'question_mode': "\n🎯 <b>Режим:</b> {mode_name}\n",
+    'question_progress': "🔢 <b>Вопрос:</b> {progress}\n",
+    'question_source': "📋 <b>Источник:</b> {source_name}\n",
+    'question_prompt': "\n❓ <b>{question_text}</b>\n\nВведи номер этого вопроса:\n",
+
+    'answer_out_of_range': "❌ Номер вопроса должен быть от 1 до {max_number}",
+    'answer_not_a_number': "❌ Пожалуйста, введи номер вопроса (число)",
+
+    'answer_correct': "✅ <b>Правильно!</b>\n\n🔥 Стрик: <b>{current_streak}</b>\n🏆 Рекорд: <b>{best_streak}</b>",
+    'new_record': "\n\n🎉 <b>НОВЫЙ РЕКОРД!</b> 🎉",
+
+    'answer_incorrect': """
+❌ <b>Неправильно!</b>
+
+Правильный ответ: <b>{correct_number}</b>
+
+🔥 <b>Жизни:</b> {lives}
+💔 Стрик сброшен.
+""",
+
+    'game_over': """
+
+🎮 <b>ИГРА ОКОНЧЕНА!</b>
+
+📊 <b>Итоговая статистика:</b>
+🔥 Финальный стрик: <b>{current_streak}</b>
+🏆 Лучший результат: <b>{best_streak}</b>
+📈 Точность: <b>{accuracy:.1f}%</b>
+
+Попробуй ещё раз! 💪
+""",
+
+    'quiz_stopped': """
+⏹️ <b>Тест остановлен</b>
+
+📊 <b>Твои результаты:</b>
+🔥 Текущий стрик: <b>{current_streak}</b>
+🏆 Лучший результат: <b>{best_streak}</b>
+
+Спасибо за тренировку! 💪
+""",
+
+    # Mock exam
+    'exam_progress': "{current} из {total}",
+    'exam_answer_correct': "✅ <b>Правильно!</b>\n",
+    'exam_answer_incorrect': "❌ <b>Неправильно!</b> Правильный ответ: <b>{correct_number}</b>\n",
+
+    'exam_summary': """
+
+📝 <b>ЭКЗАМЕН ЗАВЕРШЁН!</b>
+
+✅ Правильных ответов: <b>{correct}</b> из {total} ({percent:.0f}%)
+🎓 Оценка: <b>{grade}</b>
+""",
+    'exam_missed': "\n📚 <b>Повтори вопросы:</b> {questions}\n",
+    'exam_missed_question': "№{number} ({source})",
+    'exam_saved': "\n📝 Прогресс экзамена сохранён - его можно продолжить позже.\n",
+
+    # Errors
+    'error_start_quiz': "❌ Ошибка при запуске теста. Попробуй позже.",
+    'error_start_exam': "❌ Ошибка при запуске экзамена. Попробуй позже.",
+    'error_next_question': "❌ Ошибка при загрузке следующего вопроса",
+    'error_generic': "❌ Произошла ошибка. Попробуй позже.",
+}
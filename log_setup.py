@@ -0,0 +1,156 @@
+"""
+Logging setup module
+Moves log formatting and output off the event loop into a listener thread,
+writes structured JSON lines and rate-limits repeated errors
+"""
+
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+from typing import Dict, Tuple
+
+# Fields passed via `extra=` that are copied into the JSON record
+STRUCTURED_FIELDS = ('user_id', 'handler', 'latency_ms', 'update_id', 'suppressed')
+
+# At most this many records per message template and level within the window
+RATE_LIMIT_COUNT = 10
+RATE_LIMIT_WINDOW = 60
+
+# Number of message templates tracked before the rate limit state is reset
+RATE_LIMIT_MAX_KEYS = 1000
+
+# Share of handler latency records promoted from DEBUG to INFO
+LATENCY_SAMPLE_RATE = 0.01
+
+# Chatty third-party loggers (httpx logs every getUpdates call at INFO)
+QUIET_LOGGERS = ('httpx', 'httpcore', 'apscheduler')
+
+latency_logger = logging.getLogger('handlers.latency')
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let through at most RATE_LIMIT_COUNT WARNING+ records per message template
+    in each window. The first record after a window with drops carries the
+    number of suppressed records.
+    """
+
+    def __init__(self, count: int = RATE_LIMIT_COUNT, window: float = RATE_LIMIT_WINDOW):
+        super().__init__()
+        self.count = count
+        self.window = window
+        # (logger, level, template) -> [window start, records seen, records suppressed]
+        self.windows: Dict[Tuple[str, int, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING:
+            return True
+
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        state = self.windows.get(key)
+
+        if state is None or now - state[0] >= self.window:
+            if state is None and len(self.windows) >= RATE_LIMIT_MAX_KEYS:
+                self.windows.clear()
+            suppressed = state[2] if state else 0
+            self.windows[key] = [now, 1, 0]
+            if suppressed:
+                record.suppressed = suppressed
+            return True
+
+        state[1] += 1
+        if state[1] > self.count:
+            state[2] += 1
+            return False
+        return True
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock handler formats each record in the calling thread, which would
+    put str(Update) and traceback rendering back on the event loop.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Route all logging through a queue to a listener thread writing JSON lines.
+
+    The level can be changed with the LOG_LEVEL environment variable.
+
+    Returns:
+        The started listener, stop it on exit to flush remaining records
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+def timed_handler(callback):
+    """
+    Wrap a handler callback to log its latency with user_id and handler name.
+
+    Records are DEBUG; a LATENCY_SAMPLE_RATE share is logged at INFO so
+    production keeps a latency sample without logging every update.
+    """
+    @functools.wraps(callback)
+    async def wrapper(update, context):
+        start = time.perf_counter()
+        try:
+            return await callback(update, context)
+        finally:
+            level = logging.INFO if random.random() < LATENCY_SAMPLE_RATE else logging.DEBUG
+            if latency_logger.isEnabledFor(level):
+                user = getattr(update, 'effective_user', None)
+                latency_logger.log(level, "Handled update", extra={
+                    'user_id': user.id if user else None,
+                    'handler': callback.__name__,
+                    'latency_ms': round((time.perf_counter() - start) * 1000, 1),
+                    'update_id': getattr(update, 'update_id', None),
+                })
+
+    return wrapper
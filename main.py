@@ -4,51 +4,123 @@ Telegram Quiz Bot - Main Entry Point
 Tests knowledge of exam question numbers with intuitive button interface
 """
 
+import time
+
+# Measured before the heavy imports so the startup profile includes them
+PROCESS_START = time.perf_counter()
+
+import asyncio
+import concurrent.futures
 import logging
 import os
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters
+from telegram import Update
+from telegram.ext import (
+    Application, CommandHandler, CallbackQueryHandler, MessageHandler,
+    TypeHandler, ContextTypes, filters
+)
 
 from database import init_database
+from dedup import UpdateDeduplicator
+from log_setup import setup_logging, timed_handler
+from recorder import setup_recorder
+from shutdown import ShutdownCoordinator
 from handlers import (
-    start_command, help_command, button_callback,
+    start_command, help_command, reminders_command, button_callback,
     handle_answer, error_handler
 )
 
-# Configure logging
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
 logger = logging.getLogger(__name__)
 
+def log_startup_step(step: str):
+    """Log the time elapsed since the process started."""
+    logger.info(f"Startup: {step} after {(time.perf_counter() - PROCESS_START) * 1000:.0f} ms")
+
+def register_handlers(application: Application):
+    """Register the quiz handlers and the error handler."""
+    application.add_handler(CommandHandler("start", timed_handler(start_command)))
+    application.add_handler(CommandHandler("help", timed_handler(help_command)))
+    application.add_handler(CommandHandler("reminders", timed_handler(reminders_command)))
+    application.add_handler(CallbackQueryHandler(timed_handler(button_callback)))
+    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, timed_handler(handle_answer)))
+
+    application.add_error_handler(error_handler)
+
+async def run_bot(application: Application, coordinator: ShutdownCoordinator,
+                  deduplicator: UpdateDeduplicator, schema_check: concurrent.futures.Future):
+    """Run polling until a stop signal arrives, then shut down gracefully."""
+    coordinator.install_signal_handlers()
+
+    async with application:
+        # Re-raises a failed migration, so the bot never serves a half-migrated schema
+        await asyncio.wrap_future(schema_check)
+        await deduplicator.load()
+        log_startup_step("database ready")
+
+        await application.start()
+        await coordinator.restore_pending_updates()
+        await application.updater.start_polling(allowed_updates=["message", "callback_query"])
+        log_startup_step("polling started")
+
+        await coordinator.wait_for_stop_signal()
+        await coordinator.shutdown()
+
 def main():
     """Start the bot."""
+    # Configure logging
+    log_listener = setup_logging()
+    log_startup_step("imports done")
+
     # Get bot token from environment variable
     token = os.getenv('TELEGRAM_BOT_TOKEN')
-    
+
     if not token:
         print("ERROR: TELEGRAM_BOT_TOKEN environment variable is not set!")
         print("Please set your bot token in Railway environment variables.")
+        log_listener.stop()
         return
-    
-    # Initialize database
-    init_database()
-    
+
+    # Check the database schema in the background while the Application is
+    # built and connects to Telegram; polling only starts once it is done
+    schema_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="init_database")
+    schema_check = schema_executor.submit(init_database)
+    schema_executor.shutdown(wait=False)
+
     # Create the Application
     application = Application.builder().token(token).build()
-    
-    # Register handlers
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CallbackQueryHandler(button_callback))
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_answer))
-    
-    # Register error handler
-    application.add_error_handler(error_handler)
-    
+
+    # Drain in-flight updates and persist progress on SIGTERM
+    coordinator = ShutdownCoordinator(application)
+
+    # Drop redelivered updates before any handler runs
+    deduplicator = UpdateDeduplicator(application)
+    deduplicator.register()
+    coordinator.add_flush_callback(deduplicator.save)
+
+    # Opt-in capture of incoming updates for replay.py
+    recorder = setup_recorder(application)
+    if recorder:
+        coordinator.add_flush_callback(recorder.close)
+
+    first_update_seen = False
+
+    async def log_first_update(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        nonlocal first_update_seen
+        if not first_update_seen:
+            first_update_seen = True
+            log_startup_step("first update received")
+
+    application.add_handler(TypeHandler(Update, log_first_update), group=-1)
+
+    register_handlers(application)
+
     # Start the bot
+    log_startup_step("application built")
     logger.info("Starting Telegram Quiz Bot...")
-    application.run_polling(allowed_updates=["message", "callback_query"])
+    try:
+        asyncio.run(run_bot(application, coordinator, deduplicator, schema_check))
+    finally:
+        # Flush records still waiting in the log queue
+        log_listener.stop()
 
 if __name__ == '__main__':
     main()
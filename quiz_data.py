@@ -4,7 +4,9 @@ Contains exam questions and handles question selection logic
 """
 
 import random
-from typing import Tuple, List
+from typing import Optional, Sequence, Tuple, List
+
+from i18n import Locale, get_locale
 
 # Questions from the first file (Specialty - 15 questions)
 SPECIALTY_QUESTIONS = [
@@ -59,38 +61,99 @@ DIRECTION_QUESTIONS = [
     "Please indicate short- and long-term effects of inflation."
 ]
 
-def get_random_question(mode: str) -> Tuple[int, str, str]:
+# Question bank precompiled at import: source -> tuple of (number, text, source)
+QUESTION_BANK = {
+    'specialty': tuple(
+        (number, text, 'specialty') for number, text in enumerate(SPECIALTY_QUESTIONS, start=1)
+    ),
+    'direction': tuple(
+        (number, text, 'direction') for number, text in enumerate(DIRECTION_QUESTIONS, start=1)
+    ),
+}
+
+# All questions in a fixed order, used to index per-question statistics
+ALL_QUESTIONS = QUESTION_BANK['specialty'] + QUESTION_BANK['direction']
+
+# Offset of each source inside ALL_QUESTIONS
+SOURCE_OFFSETS = {
+    'specialty': 0,
+    'direction': len(QUESTION_BANK['specialty']),
+}
+
+# Number of questions in a mock exam session
+EXAM_LENGTH = 20
+
+# Exam grades on the Polish university scale: (minimum score in percent, grade)
+EXAM_GRADES = [
+    (91, '5.0'),
+    (81, '4.5'),
+    (71, '4.0'),
+    (61, '3.5'),
+    (51, '3.0'),
+    (0, '2.0'),
+]
+
+# Question banks each mode draws from; mixed picks a source first, then a question
+MODE_BANKS = {
+    'specialty': (QUESTION_BANK['specialty'],),
+    'direction': (QUESTION_BANK['direction'],),
+    'mixed': (QUESTION_BANK['specialty'], QUESTION_BANK['direction']),
+}
+
+def get_random_question(mode: str, weights: Optional[Sequence[int]] = None) -> Tuple[int, str, str]:
     """
     Get a random question based on the selected mode.
     
     Args:
-        mode: 'specialty', 'direction', or 'mixed'
+        mode: 'specialty', 'direction', 'mixed' or 'adaptive'
+        weights: Per-question weights in ALL_QUESTIONS order (adaptive mode only);
+            ignored if their length does not match, e.g. after questions were added
     
     Returns:
         Tuple of (question_number, question_text, source)
     """
-    if mode == 'specialty':
-        question_number = random.randint(1, len(SPECIALTY_QUESTIONS))
-        question_text = SPECIALTY_QUESTIONS[question_number - 1]
-        source = 'specialty'
-    elif mode == 'direction':
-        question_number = random.randint(1, len(DIRECTION_QUESTIONS))
-        question_text = DIRECTION_QUESTIONS[question_number - 1]
-        source = 'direction'
-    elif mode == 'mixed':
-        # Randomly choose between specialty and direction
-        if random.choice([True, False]):
-            question_number = random.randint(1, len(SPECIALTY_QUESTIONS))
-            question_text = SPECIALTY_QUESTIONS[question_number - 1]
-            source = 'specialty'
-        else:
-            question_number = random.randint(1, len(DIRECTION_QUESTIONS))
-            question_text = DIRECTION_QUESTIONS[question_number - 1]
-            source = 'direction'
-    else:
+    if mode == 'adaptive':
+        if weights is not None and len(weights) != len(ALL_QUESTIONS):
+            weights = None
+        return random.choices(ALL_QUESTIONS, weights=weights)[0]
+    
+    banks = MODE_BANKS.get(mode)
+    if banks is None:
         raise ValueError(f"Invalid mode: {mode}")
     
-    return question_number, question_text, source
+    return random.choice(random.choice(banks))
+
+def generate_exam_deck(length: int = EXAM_LENGTH) -> bytes:
+    """
+    Generate a mock exam as a shuffled selection of question indexes.
+    
+    Returns:
+        One byte per question, each an index into ALL_QUESTIONS, no repeats
+    """
+    return bytes(random.sample(range(len(ALL_QUESTIONS)), min(length, len(ALL_QUESTIONS))))
+
+def is_valid_exam_deck(deck: Optional[bytes]) -> bool:
+    """Check that a stored exam deck only refers to existing questions."""
+    return bool(deck) and max(deck) < len(ALL_QUESTIONS)
+
+def get_exam_question(deck: bytes, cursor: int) -> Tuple[int, str, str]:
+    """Get the question at the cursor position of an exam deck."""
+    return ALL_QUESTIONS[deck[cursor]]
+
+def get_exam_grade(correct: int, total: int) -> str:
+    """Get the exam grade for the given number of correct answers."""
+    score = correct / total * 100 if total else 0
+    for minimum, grade in EXAM_GRADES:
+        if score >= minimum:
+            return grade
+    return EXAM_GRADES[-1][1]
+
+def get_question_index(question_number: int, source: str) -> int:
+    """Get the position of a question in ALL_QUESTIONS, or -1 if unknown."""
+    offset = SOURCE_OFFSETS.get(source)
+    if offset is None or not 1 <= question_number <= get_max_question_number(source):
+        return -1
+    return offset + question_number - 1
 
 def validate_answer(answer: str, expected_number: int, source: str) -> bool:
     """
@@ -110,20 +173,12 @@ def validate_answer(answer: str, expected_number: int, source: str) -> bool:
     except ValueError:
         return False
 
-def get_source_display_name(source: str) -> str:
-    """Get display name for question source."""
-    if source == 'specialty':
-        return "Специальность (15 вопросов)"
-    elif source == 'direction':
-        return "Направление (30 вопросов)"
-    else:
-        return "Неизвестный источник"
+def get_source_display_name(source: str, locale: Optional[Locale] = None) -> str:
+    """Get display name for question source in the given locale (default locale if None)."""
+    names = (locale or get_locale()).source_names
+    return names.get(source, names['unknown'])
 
 def get_max_question_number(source: str) -> int:
     """Get maximum question number for the given source."""
-    if source == 'specialty':
-        return len(SPECIALTY_QUESTIONS)
-    elif source == 'direction':
-        return len(DIRECTION_QUESTIONS)
-    else:
-        return 0
+    bank = QUESTION_BANK.get(source)
+    return len(bank) if bank else 0
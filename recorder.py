@@ -0,0 +1,161 @@
+"""
+Update recorder module
+Captures incoming updates to a JSONL file for offline replay with replay.py.
+
+Recording is opt-in: set RECORD_UPDATES to the output file. Only the fields
+replay needs are kept (an allowlist); user and chat IDs are replaced with
+salted pseudonyms, names become "User" and text other than commands and
+numeric answers is masked. The salt is random per process unless
+RECORD_SALT is set, which keeps pseudonyms stable across restarts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import secrets
+import time
+from typing import Any, Dict, Iterable
+
+from telegram import Update
+from telegram.ext import Application, ContextTypes, TypeHandler
+
+logger = logging.getLogger(__name__)
+
+# Runs right after deduplication, so duplicates are not recorded
+RECORD_GROUP = -99
+
+# Fields kept in a recording, everything else is dropped
+USER_FIELDS = ('is_bot', 'language_code')
+MESSAGE_FIELDS = ('message_id', 'date')
+CALLBACK_QUERY_FIELDS = ('id', 'chat_instance', 'data')
+ENTITY_FIELDS = ('type', 'offset', 'length')
+
+# Replacement for message text that is neither a command nor a number
+MASKED_TEXT = '<text>'
+
+def pseudonymize_id(value: int, salt: str) -> int:
+    """Map a user or chat ID to a stable positive pseudonym."""
+    digest = hashlib.blake2b(f'{salt}:{value}'.encode(), digest_size=5).digest()
+    return int.from_bytes(digest, 'big') or 1
+
+def mask_text(text: str) -> str:
+    """Keep answers (numbers) and bare commands, mask any other text."""
+    stripped = text.strip()
+    if stripped.isdigit():
+        return stripped
+    if stripped.startswith('/'):
+        # Drops arguments such as deep-link payloads
+        return stripped.split(maxsplit=1)[0]
+    return MASKED_TEXT
+
+def _pick(data: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """Copy the allowed fields of an object."""
+    return {name: data[name] for name in fields if name in data}
+
+def anonymize_user(user: Dict[str, Any], salt: str) -> Dict[str, Any]:
+    """Keep a pseudonymous ID, the bot flag and the language of a user."""
+    result = _pick(user, USER_FIELDS)
+    result['id'] = pseudonymize_id(user['id'], salt)
+    result['first_name'] = 'User'
+    return result
+
+def anonymize_message(message: Dict[str, Any], salt: str) -> Dict[str, Any]:
+    """Keep the IDs, chat, sender and masked text of a message."""
+    result = _pick(message, MESSAGE_FIELDS)
+    result['chat'] = {
+        'id': pseudonymize_id(message['chat']['id'], salt),
+        'type': message['chat']['type'],
+    }
+    if 'from' in message:
+        result['from'] = anonymize_user(message['from'], salt)
+
+    if 'text' in message:
+        text = result['text'] = mask_text(message['text'])
+        # Keep the entities (the command itself) that lie in the kept text
+        if message['text'].lstrip().startswith(text):
+            offset = len(message['text']) - len(message['text'].lstrip())
+            entities = [
+                {**_pick(entity, ENTITY_FIELDS), 'offset': entity['offset'] - offset}
+                for entity in message.get('entities', ())
+                if entity['offset'] >= offset and entity['offset'] + entity['length'] <= offset + len(text)
+            ]
+            if entities:
+                result['entities'] = entities
+    return result
+
+def anonymize_update(data: Dict[str, Any], salt: str) -> Dict[str, Any]:
+    """
+    Reduce an update dict to the allowlisted fields replay needs.
+
+    Args:
+        data: Update.to_dict() output
+        salt: Salt for the ID pseudonyms
+
+    Returns:
+        Anonymized update; update types the bot does not handle keep only
+        their update_id
+    """
+    result = {'update_id': data['update_id']}
+
+    if 'message' in data:
+        result['message'] = anonymize_message(data['message'], salt)
+    elif 'callback_query' in data:
+        query = data['callback_query']
+        recorded = _pick(query, CALLBACK_QUERY_FIELDS)
+        recorded['from'] = anonymize_user(query['from'], salt)
+        if 'message' in query:
+            recorded['message'] = anonymize_message(query['message'], salt)
+        result['callback_query'] = recorded
+
+    return result
+
+class UpdateRecorder:
+    """Appends every new update to a JSONL file as {"ts": ..., "update": {...}}."""
+
+    def __init__(self, application: Application, path: str, salt: str = ''):
+        self.application = application
+        self.path = path
+        self.salt = salt
+        self.file = None
+        self.count = 0
+
+    def register(self):
+        """Open the recording and add the recording handler."""
+        self.file = open(self.path, 'a', encoding='utf-8')
+        self.application.add_handler(TypeHandler(Update, self.record), group=RECORD_GROUP)
+        logger.info(f"Recording updates to {self.path}")
+
+    async def record(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Write one anonymized update to the buffered file."""
+        entry = {'ts': round(time.time(), 3), 'update': anonymize_update(update.to_dict(), self.salt)}
+        self.file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.count += 1
+
+    async def close(self):
+        """Flush and close the recording."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            logger.info(f"Recorded {self.count} updates to {self.path}")
+
+def setup_recorder(application: Application) -> UpdateRecorder:
+    """
+    Start recording if the RECORD_UPDATES environment variable is set.
+
+    Returns:
+        The registered recorder, or None if recording is off
+    """
+    path = os.getenv('RECORD_UPDATES')
+    if not path:
+        return None
+
+    salt = os.getenv('RECORD_SALT')
+    if not salt:
+        # Without a secret salt anyone could hash known user IDs to find them
+        salt = secrets.token_hex(16)
+        logger.info("RECORD_SALT is not set, pseudonyms will change on restart")
+
+    recorder = UpdateRecorder(application, path, salt)
+    recorder.register()
+    return recorder
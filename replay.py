@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Replay module
+Feeds updates captured by recorder.py through the bot handlers against a fake
+Bot and a separate database, to reproduce incidents and measure performance
+on real traffic:
+
+    python replay.py updates.jsonl --speed 10 --db replay.db
+    python replay.py updates.jsonl --speed max --from-db quiz_bot.db
+
+--speed 1 keeps the recorded timing, 10 plays it ten times faster and max
+sends updates back to back. The report lists throughput, handler latency
+percentiles, Bot API calls and how the users table changed.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List
+
+from telegram import Update
+from telegram.ext import Application, ExtBot
+
+import database
+import handlers
+from backup import snapshot_database
+from database import get_db_connection, init_database
+from main import register_handlers
+
+logger = logging.getLogger(__name__)
+
+# Token of the fake bot, never sent anywhere
+REPLAY_TOKEN = '1:replay'
+
+REPLAY_BOT_USER = {
+    'id': 1,
+    'is_bot': True,
+    'first_name': 'Quiz Bot',
+    'username': 'replay_quiz_bot',
+}
+
+# Bot API methods answered with the sent message
+MESSAGE_METHODS = ('sendMessage', 'editMessageText', 'editMessageReplyMarkup')
+
+class ReplayBot(ExtBot):
+    """Bot that answers every API call locally and counts the calls."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._calls = Counter()
+        self._message_ids = itertools.count(1)
+
+    @property
+    def calls(self) -> Counter:
+        """Number of Bot API calls by method."""
+        return self._calls
+
+    async def _do_post(self, endpoint: str, data: Dict[str, Any], *args, **kwargs) -> Any:
+        self._calls[endpoint] += 1
+
+        if endpoint == 'getMe':
+            return REPLAY_BOT_USER
+        if endpoint in MESSAGE_METHODS:
+            return {
+                'message_id': data.get('message_id') or next(self._message_ids),
+                'date': int(time.time()),
+                'chat': {'id': data.get('chat_id', 0), 'type': 'private'},
+                'from': REPLAY_BOT_USER,
+                'text': data.get('text', ''),
+            }
+        return True
+
+def parse_speed(value: str) -> float:
+    """Parse --speed: a positive factor or 'max' (returned as 0)."""
+    if value == 'max':
+        return 0
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive or 'max'")
+    return speed
+
+def iter_recording(path: str) -> Iterator[Dict[str, Any]]:
+    """Read recorded entries from a JSONL file."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def load_users() -> Dict[int, Dict[str, Any]]:
+    """Load the users table keyed by user_id."""
+    with get_db_connection() as conn:
+        rows = conn.execute("SELECT * FROM users").fetchall()
+    return {row['user_id']: dict(row) for row in rows}
+
+def diff_users(before: Dict[int, Dict[str, Any]], after: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compare two users table states.
+
+    Returns:
+        Dictionary with new and changed user counts, changed rows per column
+        and the change of the answer totals
+    """
+    column_changes = Counter()
+    changed_users = 0
+
+    for user_id, row in after.items():
+        old = before.get(user_id)
+        if old is None:
+            continue
+        changed = [column for column, value in row.items() if old.get(column) != value]
+        if changed:
+            changed_users += 1
+            column_changes.update(changed)
+
+    totals = {}
+    for column in ('total_questions', 'correct_answers'):
+        totals[column] = (
+            sum(row[column] or 0 for row in after.values())
+            - sum(row[column] or 0 for row in before.values())
+        )
+
+    return {
+        'new_users': len(after.keys() - before.keys()),
+        'changed_users': changed_users,
+        'column_changes': dict(column_changes.most_common()),
+        'totals': totals,
+    }
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, round(fraction * len(values)) - 1))
+    return values[index]
+
+async def replay_updates(path: str, speed: float) -> Dict[str, Any]:
+    """
+    Process recorded updates one by one through the bot handlers.
+
+    Args:
+        path: Recording made by recorder.py
+        speed: Playback speed factor, 0 for no waiting between updates
+
+    Returns:
+        Dictionary with update count, elapsed time, sorted latencies (ms)
+        and Bot API calls by method
+    """
+    bot = ReplayBot(REPLAY_TOKEN)
+    application = Application.builder().bot(bot).updater(None).build()
+    register_handlers(application)
+
+    # Scale the pause before the next question along with the recording
+    handlers.NEXT_QUESTION_DELAY = handlers.NEXT_QUESTION_DELAY / speed if speed else 0
+
+    latencies = []
+    first_ts = None
+
+    async with application:
+        start = time.perf_counter()
+
+        for entry in iter_recording(path):
+            if speed:
+                if first_ts is None:
+                    first_ts = entry['ts']
+                delay = start + (entry['ts'] - first_ts) / speed - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            update = Update.de_json(entry['update'], bot)
+            update_start = time.perf_counter()
+            await application.process_update(update)
+            latencies.append((time.perf_counter() - update_start) * 1000)
+
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'updates': len(latencies),
+        'elapsed': elapsed,
+        'latencies': latencies,
+        'calls': bot.calls,
+    }
+
+def print_report(result: Dict[str, Any], changes: Dict[str, Any]):
+    """Print the replay results."""
+    latencies = result['latencies']
+    elapsed = result['elapsed']
+
+    print(f"Updates:    {result['updates']} in {elapsed:.2f} s "
+          f"({result['updates'] / elapsed if elapsed else 0:.1f} updates/s)")
+    print("Latency ms: " + ", ".join(
+        f"{name} {percentile(latencies, fraction):.1f}"
+        for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0))
+    ))
+    print(f"API calls:  {sum(result['calls'].values())} "
+          f"({', '.join(f'{method} {count}' for method, count in result['calls'].most_common())})")
+    print(f"Users:      {changes['new_users']} new, {changes['changed_users']} changed")
+    for column, count in changes['column_changes'].items():
+        print(f"  {column}: {count}")
+    for column, delta in changes['totals'].items():
+        print(f"  Δ {column}: {delta:+d}")
+
+def main():
+    """Replay a recording from the command line."""
+    parser = argparse.ArgumentParser(description="Replay recorded updates against a fake bot")
+    parser.add_argument('path', help="Recording made with RECORD_UPDATES")
+    parser.add_argument('--speed', type=parse_speed, default=parse_speed('max'),
+                        help="Playback speed: 1, 10, ... or max (default)")
+    parser.add_argument('--db', default='replay.db', help="Database the replay writes to")
+    parser.add_argument('--from-db', help="Start from a snapshot of this database instead of an empty one")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        level=os.getenv('LOG_LEVEL', 'WARNING').upper()
+    )
+
+    if os.path.abspath(args.db) == os.path.abspath(args.from_db or database.DATABASE_FILE):
+        parser.error("--db must not be the source database")
+
+    if args.from_db:
+        database.DATABASE_FILE = args.from_db
+        snapshot_database(args.db)
+    elif os.path.exists(args.db):
+        # Start from an empty database, not whatever the last replay left
+        os.remove(args.db)
+
+    database.DATABASE_FILE = args.db
+    init_database()
+
+    before = load_users()
+    result = asyncio.run(replay_updates(args.path, args.speed))
+    print_report(result, diff_users(before, load_users()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Graceful shutdown module
+Stops polling, drains in-flight updates with a deadline and keeps updates
+that could not be processed, so container restarts lose no answers
+"""
+
+import asyncio
+import json
+import logging
+import signal
+from contextlib import suppress
+from typing import Awaitable, Callable, List
+
+from telegram import Update
+from telegram.ext import Application
+
+from database import get_bot_state, set_bot_state
+
+logger = logging.getLogger(__name__)
+
+# Seconds allowed for pending updates to finish after a stop signal.
+# Railway and Docker send SIGKILL 10 seconds after SIGTERM.
+DRAIN_TIMEOUT = 8
+
+PENDING_UPDATES_KEY = 'pending_updates'
+
+class ShutdownCoordinator:
+    """Coordinates a graceful stop of the Application on SIGTERM/SIGINT."""
+
+    def __init__(self, application: Application, drain_timeout: float = DRAIN_TIMEOUT):
+        self.application = application
+        self.drain_timeout = drain_timeout
+        self.flush_callbacks: List[Callable[[], Awaitable[None]]] = []
+        self.stop_event = None
+
+    def add_flush_callback(self, callback: Callable[[], Awaitable[None]]):
+        """Register a coroutine function run after draining, e.g. to flush buffered writes."""
+        self.flush_callbacks.append(callback)
+
+    async def restore_pending_updates(self):
+        """Queue updates that were fetched but not processed before the previous shutdown."""
+        value = await asyncio.to_thread(get_bot_state, PENDING_UPDATES_KEY, '[]')
+        pending = json.loads(value)
+        if not pending:
+            return
+
+        for data in pending:
+            await self.application.update_queue.put(Update.de_json(data, self.application.bot))
+
+        await asyncio.to_thread(set_bot_state, PENDING_UPDATES_KEY, '[]')
+        logger.info(f"Restored {len(pending)} updates left over from the previous shutdown")
+
+    async def save_pending_updates(self, updates: List[Update]):
+        """Persist fetched but unprocessed updates so the next start can handle them."""
+        data = json.dumps([update.to_dict() for update in updates])
+        await asyncio.to_thread(set_bot_state, PENDING_UPDATES_KEY, data)
+
+    def take_queued_updates(self) -> List[Update]:
+        """
+        Remove all updates that are still waiting in the update queue.
+        
+        The Application's own stop marker is put back, so the update fetcher
+        still finishes once it reaches it.
+        """
+        updates = []
+        markers = []
+        queue = self.application.update_queue
+        while not queue.empty():
+            item = queue.get_nowait()
+            queue.task_done()
+            if isinstance(item, Update):
+                updates.append(item)
+            else:
+                markers.append(item)
+
+        for marker in markers:
+            queue.put_nowait(marker)
+
+        return updates
+
+    def install_signal_handlers(self):
+        """Turn SIGTERM/SIGINT into a graceful shutdown request."""
+        self.stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop_event.set)
+            except NotImplementedError:
+                # Windows event loops do not support signal handlers
+                signal.signal(sig, lambda *args: loop.call_soon_threadsafe(self.stop_event.set))
+
+    async def wait_for_stop_signal(self):
+        """Block until a stop signal is received."""
+        await self.stop_event.wait()
+        logger.info("Stop signal received, shutting down gracefully")
+
+    async def shutdown(self):
+        """
+        Stop fetching updates, drain pending ones within the deadline and
+        run the flush callbacks. The Application still has to be shut down
+        by the caller afterwards.
+        """
+        # Stop polling first - updates already fetched stay in the queue
+        if self.application.updater and self.application.updater.running:
+            await self.application.updater.stop()
+
+        # Application.stop() processes every queued and in-flight update
+        pending = self.application.update_queue.qsize()
+        logger.info(f"Draining {pending} pending updates (deadline {self.drain_timeout}s)")
+
+        stop_task = asyncio.create_task(self.application.stop())
+        done, _ = await asyncio.wait({stop_task}, timeout=self.drain_timeout)
+
+        if not done:
+            # Polling already confirmed these updates to Telegram, so keep
+            # them for the next start instead of dropping them
+            unprocessed = self.take_queued_updates()
+            logger.error(f"Drain deadline exceeded, saving {len(unprocessed)} unprocessed updates")
+
+            await self.save_pending_updates(unprocessed)
+
+            # The in-flight update is cancelled together with the event loop
+            stop_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await stop_task
+
+        for callback in self.flush_callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                logger.error(f"Error in shutdown flush callback {callback.__name__}: {e}")
+
+        logger.info("Shutdown complete")